@@ -0,0 +1,244 @@
+# backend/api.py
+"""
+Long-running HTTP service for AutoPort (FastAPI).
+
+Keeps pandas/matplotlib/jinja2 loaded between requests, runs report generation as
+background tasks and serves the generated artifacts with ETag / Last-Modified
+validators from an in-memory LRU cache.
+
+Endpoints:
+  POST /reports/{name}?source=sample.csv             -> 202, queue a generation run
+  GET  /reports?name=&status=&since=&until=&limit=&offset=   -> runs from metadata.db
+  GET  /reports/{name}/status                        -> latest run for a report
+  GET  /reports/{name}.html | /reports/{name}.pdf    -> artifacts (conditional GET)
+  GET  /reports/charts/{name}/{file}                 -> a report's chart images ("charts" is not a valid report name)
+
+Sources are files under AUTOPORT_DATA_DIR (default <repo>/examples; relative paths are
+resolved against it) or URLs starting with an entry of AUTOPORT_API_URL_ALLOWLIST
+(comma-separated, empty by default so no URLs are fetched).
+
+Run with:
+  python -m backend.run_api --port 8000
+"""
+
+import os
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, Response
+
+from backend.data_ingest import load_data
+from backend.metadata_store import get_store
+from backend.report_generator import CHARTS_DIR, REPORTS_DIR, ROOT, generate_report
+from backend.summarizer import summarize_dataframe
+from backend.utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_SOURCE = "sample.csv"
+CACHE_MAX_BYTES = int(os.environ.get("AUTOPORT_API_CACHE_BYTES", 64 * 1024 * 1024))
+DATA_DIR = Path(os.environ.get("AUTOPORT_DATA_DIR") or ROOT / "examples").resolve()
+URL_ALLOWLIST = tuple(u.strip() for u in os.environ.get("AUTOPORT_API_URL_ALLOWLIST", "").split(",")
+                      if u.strip())
+
+_NAME_RE = re.compile(r"^[A-Za-z0-9_\-]+$")
+_RESERVED_NAMES = {"charts"}  # /reports/charts/... serves chart images
+_MEDIA_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".pdf": "application/pdf",
+    ".png": "image/png",
+}
+
+app = FastAPI(title="AutoPort")
+
+
+class ArtifactCache:
+    """
+    LRU of artifact bytes bounded by total size. Entries are keyed by path and
+    validated against (mtime_ns, size), so a regenerated file is picked up on the next
+    request without explicit invalidation.
+    """
+
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # path -> (mtime_ns, size, etag, body)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: Path):
+        """Return (body, etag, mtime) for path, reading it only when not cached or stale."""
+        st = path.stat()
+        key = str(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                self._entries.move_to_end(key)
+                return entry[3], entry[2], st.st_mtime
+
+        body = path.read_bytes()
+        etag = '"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old:
+                self._bytes -= len(old[3])
+            if len(body) <= self.max_bytes:
+                self._entries[key] = (st.st_mtime_ns, st.st_size, etag, body)
+                self._bytes += len(body)
+                while self._bytes > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._bytes -= len(evicted[3])
+        return body, etag, st.st_mtime
+
+
+artifact_cache = ArtifactCache()
+
+# pyplot is not safe for concurrent runs
+_generate_lock = threading.Lock()
+_active = {}  # report name -> (metadata row id, resolved source) of the queued/running run
+_active_lock = threading.Lock()
+
+
+def _check_name(name: str):
+    if not _NAME_RE.match(name):
+        raise HTTPException(status_code=400, detail="Report names may only contain letters, digits, '_' and '-'")
+    if name in _RESERVED_NAMES:
+        raise HTTPException(status_code=400, detail=f"'{name}' is reserved and cannot be used as a report name")
+
+
+def _url_allowed(url: str) -> bool:
+    parts = urlsplit(url)
+    for allowed in URL_ALLOWLIST:
+        prefix = urlsplit(allowed)
+        if (parts.scheme, parts.netloc.lower()) != (prefix.scheme, prefix.netloc.lower()):
+            continue
+        base = prefix.path.rstrip("/")
+        if parts.path == base or parts.path.startswith(base + "/"):
+            return True
+    return False
+
+
+def _resolve_source(source: str) -> str:
+    """Map a client-supplied source to a file under DATA_DIR or an allowlisted URL."""
+    if "://" in source:
+        if source.startswith(("http://", "https://")) and _url_allowed(source):
+            return source
+        raise HTTPException(status_code=400, detail="Source URL is not on the allowlist")
+    path = (DATA_DIR / source).resolve()
+    if not path.is_relative_to(DATA_DIR):
+        raise HTTPException(status_code=400, detail="Sources must be files inside the data directory")
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail=f"Source not found: {source}")
+    return str(path)
+
+
+def _run_report(run_id: int, name: str, source: str):
+    store = get_store()
+    try:
+        with _generate_lock:
+            df = load_data(source)
+            summary = summarize_dataframe(df)
+            paths = generate_report(df, summary_text=summary, report_name=name)
+        store.finish_run(run_id, "success", f"html={paths['html']} pdf={paths['pdf']}")
+        logger.info("API run %s for %s finished", run_id, name)
+    except Exception as e:
+        logger.exception("API run %s for %s failed: %s", run_id, name, e)
+        store.finish_run(run_id, "failed", str(e))
+    finally:
+        with _active_lock:
+            _active.pop(name, None)
+
+
+def _artifact_response(request: Request, path: Path) -> Response:
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="Not found")
+    body, etag, mtime = artifact_cache.get(path)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(mtime, usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if etag in [t.strip() for t in if_none_match.split(",")] or if_none_match.strip() == "*":
+            return Response(status_code=304, headers=headers)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                if int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp():
+                    return Response(status_code=304, headers=headers)
+            except (TypeError, ValueError):
+                pass
+
+    media_type = _MEDIA_TYPES.get(path.suffix.lower(), "application/octet-stream")
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+@app.post("/reports/{name}", status_code=202)
+def trigger_report(name: str, background_tasks: BackgroundTasks, source: str = DEFAULT_SOURCE):
+    """
+    Queue a generation run. A run already queued for the same name and source is
+    reused; one for a different source answers 409.
+    """
+    _check_name(name)
+    resolved = _resolve_source(source)
+    with _active_lock:
+        if name in _active:
+            run_id, active_source = _active[name]
+            if active_source != resolved:
+                raise HTTPException(status_code=409,
+                                    detail=f"A run for {name} from another source is in progress (id {run_id})")
+            return {"id": run_id, "name": name, "status": "running", "reused": True}
+        run_id = get_store().start_run(name, [source], details="api")
+        _active[name] = (run_id, resolved)
+    background_tasks.add_task(_run_report, run_id, name, resolved)
+    return {"id": run_id, "name": name, "status": "running", "reused": False}
+
+
+@app.get("/reports")
+def list_runs(name: Optional[str] = None, status: Optional[str] = None,
+              since: Optional[str] = None, until: Optional[str] = None,
+              limit: int = 20, offset: int = 0):
+    store = get_store()
+    limit = max(1, min(limit, 500))
+    return {
+        "total": store.count(name=name, status=status, since=since, until=until),
+        "items": store.query(name=name, status=status, since=since, until=until,
+                             limit=limit, offset=max(0, offset)),
+    }
+
+
+@app.get("/reports/charts/{name}/{filename}")
+def get_chart(name: str, filename: str, request: Request):
+    _check_name(name)
+    if "/" in filename or "\\" in filename or filename.startswith("."):
+        raise HTTPException(status_code=400, detail="Invalid file name")
+    return _artifact_response(request, CHARTS_DIR / name / filename)
+
+
+@app.get("/reports/{name}/status")
+def report_status(name: str):
+    _check_name(name)
+    latest = get_store().latest(name)
+    if latest is None:
+        raise HTTPException(status_code=404, detail=f"No runs recorded for {name}")
+    return latest
+
+
+@app.get("/reports/{name}.html")
+def get_report_html(name: str, request: Request):
+    _check_name(name)
+    return _artifact_response(request, REPORTS_DIR / f"{name}.html")
+
+
+@app.get("/reports/{name}.pdf")
+def get_report_pdf(name: str, request: Request):
+    _check_name(name)
+    return _artifact_response(request, REPORTS_DIR / f"{name}.pdf")
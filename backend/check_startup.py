@@ -0,0 +1,98 @@
+# backend/check_startup.py
+"""
+Import-time budget check for AutoPort entry points.
+
+Imports each CLI module in a fresh interpreter with `python -X importtime` and fails
+when a heavy dependency is pulled in at import time or the module's cumulative import
+time exceeds the budget. tests/test_startup.py runs it with the test suite.
+
+Usage:
+  python -m backend.check_startup
+  python -m backend.check_startup --budget-ms 150 --module backend.run_scheduler
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ENTRY_MODULES = (
+    "backend.run_scheduler",
+    "backend.run_demo",
+    "backend.run_api",
+    "backend.notifier",
+    "backend.utils",
+)
+
+# must only be imported when actually used
+HEAVY_MODULES = (
+    "pandas",
+    "numpy",
+    "matplotlib",
+    "jinja2",
+    "requests",
+    "dotenv",
+    "apscheduler",
+    "fastapi",
+    "uvicorn",
+)
+
+DEFAULT_BUDGET_MS = 100
+
+
+def measure(module: str) -> Tuple[Dict[str, int], int]:
+    """
+    Import module in a new interpreter. Returns ({imported module: cumulative us},
+    cumulative microseconds for module itself).
+    """
+    res = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(ROOT), capture_output=True, text=True, check=False,
+    )
+    if res.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{res.stderr.strip()}")
+
+    imported = {}
+    for line in res.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # header line
+        imported[parts[2].strip()] = int(parts[1])
+    return imported, imported.get(module, 0)
+
+
+def check(modules=ENTRY_MODULES, budget_ms: float = DEFAULT_BUDGET_MS) -> List[str]:
+    """Return a list of budget violations (empty when every module is within budget)."""
+    problems = []
+    for module in modules:
+        imported, total_us = measure(module)
+        heavy = sorted(name for name in imported if name in HEAVY_MODULES)
+        print(f"{module}: {total_us / 1000:.1f} ms" + (f" (heavy: {', '.join(heavy)})" if heavy else ""))
+        if heavy:
+            problems.append(f"{module} imports {', '.join(heavy)} at import time")
+        if total_us / 1000 > budget_ms:
+            problems.append(f"{module} took {total_us / 1000:.1f} ms to import (budget {budget_ms} ms)")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check import-time budget of AutoPort entry points")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Max cumulative import time per module (default {DEFAULT_BUDGET_MS})")
+    parser.add_argument("--module", action="append",
+                        help="Module to check (repeatable; default: all entry points)")
+    args = parser.parse_args()
+
+    problems = check(args.module or ENTRY_MODULES, budget_ms=args.budget_ms)
+    for p in problems:
+        print("FAIL:", p)
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,6 @@ from pathlib import Path
 from typing import Optional, List
 import json
 import pandas as pd
-import requests
 
 from backend.utils import get_logger
 
@@ -59,6 +58,8 @@ def load_json(path: str, **kwargs) -> pd.DataFrame:
 
 
 def load_api(url: str, timeout: int = 10, **kwargs) -> pd.DataFrame:
+    import requests  # only needed for API sources
+
     logger.info("Fetching API: %s", url)
     resp = requests.get(url, timeout=timeout)
     resp.raise_for_status()
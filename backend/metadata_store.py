@@ -0,0 +1,288 @@
+# backend/metadata_store.py
+"""
+SQLite-backed store for report run metadata (metadata.db).
+
+- one connection per process and database file, reused across calls (reopened after fork)
+- WAL journal so readers never block the writer, busy timeout instead of "database is locked"
+- indexes on name, status and timestamp
+- optional batched inserts (batch_size > 1, or `with store.batch(): ...`)
+- start_run()/finish_run() for runs whose status is polled while they are in progress
+- filtered, paginated queries and retention compaction
+
+Usage:
+    store = get_store()
+    store.log("sales", ["examples/sample.csv"], status="success")
+    rows = store.query(name="sales", status="failed", since="2024-01-01", limit=50, offset=0)
+    store.compact(keep_days=30)
+"""
+
+import os
+import json
+import atexit
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional, Union
+
+from backend.utils import DEFAULT_DB, get_logger
+
+logger = get_logger(__name__)
+
+SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS reports (
+      id INTEGER PRIMARY KEY,
+      name TEXT,
+      timestamp TEXT,
+      source_files TEXT,
+      status TEXT,
+      details TEXT
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_reports_name_ts ON reports (name, timestamp)',
+    'CREATE INDEX IF NOT EXISTS idx_reports_status_ts ON reports (status, timestamp)',
+    'CREATE INDEX IF NOT EXISTS idx_reports_ts ON reports (timestamp)',
+]
+
+COLUMNS = ("id", "name", "timestamp", "source_files", "status", "details")
+
+TimeArg = Union[str, datetime, None]
+
+
+def utc_timestamp(dt: datetime = None) -> str:
+    """Timestamp format stored in the reports table (fixed width, so it sorts as text)."""
+    dt = dt or datetime.utcnow()
+    return dt.isoformat(timespec="microseconds") + 'Z'
+
+
+def _row_to_dict(row) -> dict:
+    item = dict(zip(COLUMNS, row))
+    try:
+        item["source_files"] = json.loads(item["source_files"] or "[]")
+    except ValueError:
+        pass
+    return item
+
+
+def _time_bound(value: TimeArg) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return utc_timestamp(value)
+
+
+class MetadataStore:
+    """Report metadata for one database file; safe to share between threads."""
+
+    def __init__(self, db_path: str = None, batch_size: int = 1, busy_timeout: float = 5.0):
+        self.db_path = db_path or DEFAULT_DB
+        self.batch_size = max(1, batch_size)
+        self.busy_timeout = busy_timeout
+        self._lock = threading.RLock()
+        self._conn = None
+        self._pid = None
+        self._pending = []
+        self._batch_depth = 0
+
+    # -------------------------
+    # Connection
+    # -------------------------
+    def connection(self) -> sqlite3.Connection:
+        """Return this process's connection, opening and initialising it on first use."""
+        if self._conn is None or self._pid != os.getpid():
+            directory = os.path.dirname(os.path.abspath(self.db_path))
+            os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            with conn:
+                for stmt in SCHEMA:
+                    conn.execute(stmt)
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    # -------------------------
+    # Writes
+    # -------------------------
+    def log(self, name: str, source_files: Iterable[str], status: str = 'success',
+            details: str = None, timestamp: TimeArg = None) -> bool:
+        """Record one report run. Written immediately unless batching is active."""
+        row = (name, _time_bound(timestamp) or utc_timestamp(),
+               json.dumps(list(source_files or [])), status, details or "")
+        with self._lock:
+            self._pending.append(row)
+            if self._batch_depth == 0 and len(self._pending) >= self.batch_size:
+                self.flush()
+        return True
+
+    def start_run(self, name: str, source_files: Iterable[str], details: str = None) -> int:
+        """Insert a 'running' row straight away and return its id (see finish_run)."""
+        with self._lock:
+            self.flush()
+            conn = self.connection()
+            with conn:
+                cur = conn.execute(
+                    'INSERT INTO reports (name, timestamp, source_files, status, details) VALUES (?,?,?,?,?)',
+                    (name, utc_timestamp(), json.dumps(list(source_files or [])), 'running', details or ""))
+            return cur.lastrowid
+
+    def finish_run(self, report_id: int, status: str, details: str = None):
+        """Set the final status (and optionally details) of a run created by start_run."""
+        with self._lock:
+            conn = self.connection()
+            with conn:
+                if details is None:
+                    conn.execute('UPDATE reports SET status = ? WHERE id = ?', (status, report_id))
+                else:
+                    conn.execute('UPDATE reports SET status = ?, details = ? WHERE id = ?',
+                                 (status, details, report_id))
+
+    def log_many(self, rows: Iterable[dict]) -> int:
+        """Insert several runs (dicts with log() keyword arguments) in one transaction."""
+        count = 0
+        with self.batch():
+            for row in rows:
+                self.log(**row)
+                count += 1
+        return count
+
+    @contextmanager
+    def batch(self):
+        """Buffer every log() inside the block and write them in a single transaction."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush()
+
+    def flush(self) -> int:
+        """Write buffered rows; returns how many were written."""
+        with self._lock:
+            if not self._pending:
+                return 0
+            rows, self._pending = self._pending, []
+            conn = self.connection()
+            with conn:
+                conn.executemany(
+                    'INSERT INTO reports (name, timestamp, source_files, status, details) VALUES (?,?,?,?,?)',
+                    rows)
+            return len(rows)
+
+    # -------------------------
+    # Reads
+    # -------------------------
+    @staticmethod
+    def _where(name, status, since, until):
+        clauses, params = [], []
+        if name is not None:
+            clauses.append('name = ?')
+            params.append(name)
+        if status is not None:
+            clauses.append('status = ?')
+            params.append(status)
+        if since is not None:
+            clauses.append('timestamp >= ?')
+            params.append(_time_bound(since))
+        if until is not None:
+            clauses.append('timestamp < ?')
+            params.append(_time_bound(until))
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def query(self, name: str = None, status: str = None, since: TimeArg = None,
+              until: TimeArg = None, limit: int = 20, offset: int = 0,
+              newest_first: bool = True) -> List[dict]:
+        """
+        Filtered, paginated listing. since is inclusive, until exclusive; both accept
+        ISO strings or datetimes (naive datetimes are taken as UTC).
+        """
+        where, params = self._where(name, status, since, until)
+        order = 'DESC' if newest_first else 'ASC'
+        sql = (f'SELECT {", ".join(COLUMNS)} FROM reports{where} '
+               f'ORDER BY timestamp {order}, id {order} LIMIT ? OFFSET ?')
+        with self._lock:
+            self.flush()
+            rows = self.connection().execute(sql, params + [limit, offset]).fetchall()
+        return [_row_to_dict(row) for row in rows]
+
+    def count(self, name: str = None, status: str = None, since: TimeArg = None,
+              until: TimeArg = None) -> int:
+        where, params = self._where(name, status, since, until)
+        with self._lock:
+            self.flush()
+            return self.connection().execute(f'SELECT COUNT(*) FROM reports{where}', params).fetchone()[0]
+
+    def get(self, report_id: int) -> Optional[dict]:
+        with self._lock:
+            self.flush()
+            row = self.connection().execute(
+                f'SELECT {", ".join(COLUMNS)} FROM reports WHERE id = ?', (report_id,)).fetchone()
+        return _row_to_dict(row) if row else None
+
+    def latest(self, name: str) -> Optional[dict]:
+        rows = self.query(name=name, limit=1)
+        return rows[0] if rows else None
+
+    # -------------------------
+    # Retention
+    # -------------------------
+    def compact(self, keep_days: float = None, keep_last: int = None, vacuum: bool = False) -> int:
+        """
+        Delete runs older than keep_days and/or beyond the newest keep_last rows,
+        then checkpoint the WAL (and VACUUM when asked). Returns rows deleted.
+        """
+        deleted = 0
+        with self._lock:
+            self.flush()
+            conn = self.connection()
+            with conn:
+                if keep_days is not None:
+                    cutoff = utc_timestamp(datetime.utcnow() - timedelta(days=keep_days))
+                    deleted += conn.execute('DELETE FROM reports WHERE timestamp < ?', (cutoff,)).rowcount
+                if keep_last is not None:
+                    deleted += conn.execute(
+                        'DELETE FROM reports WHERE id NOT IN '
+                        '(SELECT id FROM reports ORDER BY timestamp DESC, id DESC LIMIT ?)',
+                        (keep_last,)).rowcount
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            if vacuum:
+                conn.execute('VACUUM')
+        logger.info("Compacted metadata DB %s: %d row(s) deleted", self.db_path, deleted)
+        return deleted
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(db_path: str = None) -> MetadataStore:
+    """Return the shared MetadataStore for db_path (default metadata.db)."""
+    key = os.path.abspath(db_path or DEFAULT_DB)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = MetadataStore(key)
+            _stores[key] = store
+        return store
+
+
+@atexit.register
+def _close_stores():
+    for store in list(_stores.values()):
+        try:
+            store.close()
+        except Exception as e:
+            logger.warning("Could not close metadata store %s: %s", store.db_path, e)
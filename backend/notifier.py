@@ -5,29 +5,583 @@ Notifier module for AutoPort:
 - notify_email(subject, body, to_email)
 - notify_webhook(message)
 - notify(report_path, report_name)  <-- wrapper for run_demo/scheduler
+- NotificationDispatcher / get_dispatcher() / close_dispatcher()  <-- concurrent delivery with retries + on-disk outbox
+- DigestBuffer  <-- batches non-urgent messages per recipient/channel
+
+Email and webhook deliveries go through a shared dispatcher which keeps one SMTP
+connection and one pooled HTTP session open, sends channels concurrently on a small
+thread pool and retries failures with exponential backoff. Every pending delivery is
+written to an outbox directory first, so anything still undelivered is retried by the
+next process that starts a dispatcher.
+
+Outbox entries are claimed before they are sent: `<id>.<pid>.inflight` belongs to the
+process `pid`, `<id>.json` (given up after all retries) belongs to nobody. A starting
+dispatcher only takes over unowned entries and in-flight ones whose owner has exited
+or has not touched them for longer than a full retry cycle. Owners keep every queued
+entry's mtime fresh, and a worker that finds its file gone skips the send.
+
+Digest mode (NOTIFY_DIGEST_WINDOW and/or NOTIFY_DIGEST_MAX) buffers non-urgent messages
+and sends one combined email per recipient and one webhook post per URL when the window
+elapses or the buffer reaches the count. Messages sent with urgent=True skip the buffer.
+
+Environment:
+  SMTP_SERVER, SMTP_PORT, SMTP_USER, SMTP_PASSWORD, SMTP_SSL (default "1")
+  WEBHOOK_URL, NOTIFY_EMAIL
+  AUTOPORT_OUTBOX_DIR (default <repo>/outbox)
+  NOTIFY_DIGEST_WINDOW (seconds, unset/0 = off), NOTIFY_DIGEST_MAX (messages per digest)
 """
 
 import os
+import json
 import time
-import smtplib
-from email.message import EmailMessage
-
-try:
-    import requests
-except Exception:
-    requests = None
+import uuid
+import atexit
+import importlib.util
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
+from typing import Dict, List, Optional
 
-# Optional auto-load .env if python-dotenv installed
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except Exception:
-    pass
+# smtplib, email and requests are imported on first send to keep CLI startup fast
 
 # ✅ Use centralized logger
-from backend.utils import get_logger
+from backend.utils import BASE_DIR, _env_flag, ensure_dir, get_logger, load_env
 logger = get_logger(__name__)
 
+DEFAULT_OUTBOX_DIR = os.path.join(BASE_DIR, "outbox")
+OUTBOX_MAX_AGE = 24 * 60 * 60  # seconds an undelivered message is kept around
+OUTBOX_INFLIGHT = ".inflight"
+
+
+class PermanentDeliveryError(Exception):
+    """Delivery failed in a way retrying will not fix (e.g. HTTP 4xx, SMTP 5xx)."""
+
+
+def _requests_available() -> bool:
+    return importlib.util.find_spec("requests") is not None
+
+
+def _smtp_is_permanent(exc: Exception) -> bool:
+    """5xx SMTP replies (bad credentials, refused sender or recipients) will not pass on retry."""
+    import smtplib
+
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        codes = [code for code, _ in exc.recipients.values()]
+        return bool(codes) and all(code >= 500 for code in codes)
+    return isinstance(exc, smtplib.SMTPResponseException) and exc.smtp_code >= 500
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == "nt":
+        return True  # os.kill would terminate it; rely on the retry horizon instead
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _env_number(name: str, cast=float):
+    value = os.getenv(name)
+    if not value:
+        return None
+    try:
+        return cast(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, value)
+        return None
+
+
+class DigestBuffer:
+    """
+    Collect non-urgent notifications per (channel, recipient) and send each group as a
+    single message once `window` seconds have passed since its first item, or as soon
+    as it holds `max_items` messages. Either limit may be None (but not both).
+    """
+
+    def __init__(self, dispatcher: "NotificationDispatcher",
+                 window: Optional[float] = None, max_items: Optional[int] = None):
+        if not window and not max_items:
+            raise ValueError("DigestBuffer needs a window or a max_items limit")
+        self.dispatcher = dispatcher
+        self.window = window
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self._buckets = {}  # (channel, recipient) -> {"items": [...], "timer": Timer}
+
+    def add(self, channel: str, recipient: str, message: str, subject: str = None) -> Future:
+        """Buffer one message; the Future resolves when the digest holding it is delivered."""
+        future = Future()
+        key = (channel, recipient)
+        ready = None
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = {"items": [], "timer": None}
+                self._buckets[key] = bucket
+                if self.window:
+                    timer = threading.Timer(self.window, self._flush_expired, args=(key, bucket))
+                    timer.daemon = True
+                    bucket["timer"] = timer
+                    timer.start()
+            bucket["items"].append((time.strftime("%Y-%m-%d %H:%M:%S"), subject, message, future))
+            if self.max_items and len(bucket["items"]) >= self.max_items:
+                ready = self._pop(key)
+        if ready:
+            self._send(key, ready)
+        return future
+
+    def flush(self, key: tuple = None):
+        """Send the buffered digest for one key, or for every key when key is None."""
+        with self._lock:
+            keys = [key] if key is not None else list(self._buckets)
+            batches = [(k, self._pop(k)) for k in keys if k in self._buckets]
+        for k, items in batches:
+            self._send(k, items)
+
+    def _flush_expired(self, key: tuple, bucket: dict):
+        # the timer may fire after its bucket was already sent (count limit, flush());
+        # never send a newer bucket for the same key before its own window is up
+        with self._lock:
+            if self._buckets.get(key) is not bucket:
+                return
+            items = self._pop(key)
+        self._send(key, items)
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(len(b["items"]) for b in self._buckets.values())
+
+    def _pop(self, key: tuple) -> list:
+        bucket = self._buckets.pop(key)
+        if bucket["timer"] is not None:
+            bucket["timer"].cancel()
+        return bucket["items"]
+
+    def _send(self, key: tuple, items: list):
+        channel, recipient = key
+        count = len(items)
+        if channel == "email":
+            body = "\n\n".join(
+                f"[{ts}] {subject}\n{message}" if subject else f"[{ts}] {message}"
+                for ts, subject, message, _ in items
+            )
+            payload = {
+                "subject": f"[AutoPort] Digest: {count} notification{'s' if count != 1 else ''}",
+                "body": body,
+                "to": recipient,
+            }
+        else:
+            lines = "\n".join(f"• [{ts}] {message}" for ts, _, message, _ in items)
+            payload = {"message": f"AutoPort digest ({count}):\n{lines}", "url": recipient}
+        logger.info("Sending %s digest of %d message(s) to %s", channel, count, recipient)
+
+        try:
+            delivery = self.dispatcher.submit(channel, payload)
+        except Exception as e:
+            logger.error("Could not send %s digest to %s: %s", channel, recipient, e)
+            for *_, future in items:
+                future.set_exception(e)
+            return
+
+        def _resolve(done: Future):
+            ok = not done.cancelled() and done.exception() is None and done.result()
+            for *_, future in items:
+                future.set_result(bool(ok))
+        delivery.add_done_callback(_resolve)
+
+
+class NotificationDispatcher:
+    """
+    Deliver email and webhook notifications off the calling thread.
+
+    - one persistent SMTP connection (reconnects when the server drops it)
+    - one requests.Session with a connection pool for webhooks
+    - bounded retries with exponential backoff per delivery
+    - JSON outbox on disk; entries are claimed per process and removed once delivered
+    """
+
+    def __init__(self,
+                 smtp_server: str = None,
+                 smtp_port: int = None,
+                 smtp_user: str = None,
+                 smtp_password: str = None,
+                 smtp_ssl: bool = None,
+                 webhook_url: str = None,
+                 outbox_dir: str = None,
+                 max_workers: int = 4,
+                 max_retries: int = 3,
+                 backoff: float = 1.0,
+                 timeout: float = 10,
+                 digest_window: float = None,
+                 digest_max: int = None):
+        self.smtp_server = smtp_server or os.getenv("SMTP_SERVER", "smtp.gmail.com")
+        self.smtp_port = int(smtp_port or os.getenv("SMTP_PORT", 465))
+        self.smtp_user = smtp_user if smtp_user is not None else os.getenv("SMTP_USER")
+        self.smtp_password = smtp_password if smtp_password is not None else os.getenv("SMTP_PASSWORD")
+        self.smtp_ssl = smtp_ssl if smtp_ssl is not None else _env_flag("SMTP_SSL", True)
+        self.webhook_url = webhook_url if webhook_url is not None else os.getenv("WEBHOOK_URL")
+        self.outbox_dir = outbox_dir or os.getenv("AUTOPORT_OUTBOX_DIR", DEFAULT_OUTBOX_DIR)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+        ensure_dir(self.outbox_dir)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="autoport-notify")
+        self.max_workers = max_workers
+        self._smtp = None
+        self._smtp_lock = threading.Lock()
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._closed = False
+        self._owned = set()  # outbox files this process has queued or is delivering
+        self._owned_lock = threading.Lock()
+        self._heartbeat = None
+        self._stop_heartbeat = threading.Event()
+
+        if digest_window is None:
+            digest_window = _env_number("NOTIFY_DIGEST_WINDOW")
+        if digest_max is None:
+            digest_max = _env_number("NOTIFY_DIGEST_MAX", int)
+        self.digest = None
+        if digest_window or digest_max:
+            self.digest = DigestBuffer(self, window=digest_window, max_items=digest_max)
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    def dispatch(self, message: str, subject: str = None, to_email: str = None,
+                 webhook: bool = True, urgent: bool = False) -> Dict[str, Future]:
+        """
+        Queue an email (when to_email is given) and a webhook post (when a webhook URL
+        is configured and webhook=True). In digest mode non-urgent messages are buffered;
+        urgent=True always sends straight away. Returns {channel: Future} for what was
+        queued; each Future resolves to True when delivered, False otherwise.
+        """
+        subject = subject or "[AutoPort] Notification"
+        buffered = self.digest is not None and not urgent
+        futures = {}
+        if to_email:
+            if not self.smtp_user:
+                logger.warning("SMTP_USER not set, skipping email")
+            elif buffered:
+                futures["email"] = self.digest.add("email", to_email, message, subject)
+            else:
+                futures["email"] = self.submit("email", {
+                    "subject": subject,
+                    "body": message,
+                    "to": to_email,
+                })
+        if webhook:
+            if not self.webhook_url:
+                logger.warning("WEBHOOK_URL not set, skipping webhook")
+            elif not _requests_available():
+                logger.warning("requests not installed, cannot send webhook")
+            elif buffered:
+                futures["webhook"] = self.digest.add("webhook", self.webhook_url, message)
+            else:
+                futures["webhook"] = self.submit("webhook", {"message": message, "url": self.webhook_url})
+        return futures
+
+    def submit(self, channel: str, payload: dict) -> Future:
+        """Persist a delivery to the outbox and hand it to the worker pool."""
+        entry = {
+            "id": f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}",
+            "channel": channel,
+            "payload": payload,
+            "created": time.time(),
+        }
+        path = self._write_outbox(entry)
+        try:
+            return self._executor.submit(self._deliver, entry, path)
+        except RuntimeError as e:
+            # the pool is gone (close() or interpreter exit shut it down): send on this thread
+            logger.warning("Worker pool unavailable (%s); sending %s on the calling thread", e, channel)
+            future = Future()
+            future.set_result(self._deliver(entry, path))
+            return future
+
+    def send_now(self, channel: str, payload: dict) -> bool:
+        """Deliver on the calling thread (with retries), without touching the outbox."""
+        entry = {"id": None, "channel": channel, "payload": payload, "created": time.time()}
+        return self._deliver(entry, None)
+
+    def resend_pending(self) -> List[Future]:
+        """
+        Claim and re-queue outbox entries nobody else is delivering: unowned ones and
+        in-flight ones whose owner exited or went quiet past retry_horizon(). Entries
+        older than OUTBOX_MAX_AGE are dropped.
+        """
+        futures = []
+        now = time.time()
+        pid = os.getpid()
+        for fname in sorted(os.listdir(self.outbox_dir)):
+            if fname.endswith(".json"):
+                entry_id = fname[:-len(".json")]
+            elif fname.endswith(OUTBOX_INFLIGHT):
+                entry_id, _, owner = fname[:-len(OUTBOX_INFLIGHT)].rpartition(".")
+                if not owner.isdigit() or int(owner) == pid:
+                    continue
+                try:
+                    quiet = now - os.path.getmtime(os.path.join(self.outbox_dir, fname))
+                except FileNotFoundError:
+                    continue  # finished or claimed in the meantime
+                if _pid_alive(int(owner)) and quiet < self.retry_horizon():
+                    continue
+            else:
+                continue
+            path = self._claim_outbox(fname, entry_id)
+            if path is None:
+                continue  # another process claimed it first
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning("Unreadable outbox entry %s: %s", fname, e)
+                continue
+            if now - entry.get("created", now) > OUTBOX_MAX_AGE:
+                logger.warning("Dropping expired %s notification %s", entry.get("channel"), entry.get("id"))
+                self._remove_outbox(path)
+                continue
+            logger.info("Re-sending pending %s notification %s", entry.get("channel"), entry.get("id"))
+            futures.append(self._executor.submit(self._deliver, entry, path))
+        return futures
+
+    def retry_horizon(self) -> float:
+        """Upper bound (seconds) on one delivery attempt plus the backoff before the next."""
+        return self.backoff * 2 ** max(self.max_retries - 1, 0) + 3 * self.timeout + 60
+
+    def close(self, wait: bool = True):
+        """Send any buffered digests, stop the worker pool and close SMTP/HTTP connections."""
+        if self._closed:
+            return
+        if self.digest is not None:
+            self.digest.flush()
+        self._closed = True
+        self._executor.shutdown(wait=wait)
+        self._stop_heartbeat.set()
+        with self._smtp_lock:
+            self._close_smtp()
+        if self._session is not None:
+            self._session.close()
+
+    # -------------------------
+    # Delivery
+    # -------------------------
+    def _deliver(self, entry: dict, path: Optional[str]) -> bool:
+        channel = entry["channel"]
+        sender = {"email": self._send_email, "webhook": self._send_webhook}.get(channel)
+        if sender is None:
+            logger.error("Unknown notification channel: %s", channel)
+            self._remove_outbox(path)
+            return False
+
+        for attempt in range(1, self.max_retries + 1):
+            if not self._touch_outbox(path):
+                # another process decided we had gone quiet and took the entry over
+                logger.warning("%s notification %s was claimed by another process; not sending",
+                               channel, entry["id"])
+                self._disown(path)
+                return False
+            try:
+                sender(entry["payload"])
+                self._remove_outbox(path)
+                return True
+            except PermanentDeliveryError as e:
+                logger.error("Failed to send %s (not retrying): %s", channel, e)
+                self._remove_outbox(path)
+                return False
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.error("Failed to send %s after %d attempts: %s", channel, attempt, e)
+                    break
+                delay = self.backoff * (2 ** (attempt - 1))
+                logger.warning("Failed to send %s (attempt %d/%d): %s; retrying in %.1fs",
+                               channel, attempt, self.max_retries, e, delay)
+                time.sleep(delay)
+        # hand the outbox entry back for the next run
+        self._release_outbox(path, entry["id"])
+        return False
+
+    def _send_email(self, payload: dict):
+        import smtplib
+        from email.message import EmailMessage
+
+        msg = EmailMessage()
+        msg["Subject"] = payload["subject"]
+        msg["From"] = self.smtp_user
+        msg["To"] = payload["to"]
+        msg.set_content(payload["body"])
+
+        with self._smtp_lock:
+            try:
+                try:
+                    self._smtp_connection().send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    # idle connection dropped by the server: reconnect once straight away
+                    self._close_smtp()
+                    self._smtp_connection().send_message(msg)
+            except Exception as e:
+                self._close_smtp()
+                if _smtp_is_permanent(e):
+                    raise PermanentDeliveryError(f"SMTP rejected the message: {e}") from e
+                raise
+        logger.info("Email sent to %s", payload["to"])
+
+    def _smtp_connection(self):
+        import smtplib
+
+        if self._smtp is None:
+            smtp_cls = smtplib.SMTP_SSL if self.smtp_ssl else smtplib.SMTP
+            smtp = smtp_cls(self.smtp_server, self.smtp_port, timeout=self.timeout)
+            if self.smtp_user and self.smtp_password:
+                smtp.login(self.smtp_user, self.smtp_password)
+            self._smtp = smtp
+        return self._smtp
+
+    def _close_smtp(self):
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except Exception:
+            try:
+                self._smtp.close()
+            except Exception:
+                pass
+        self._smtp = None
+
+    def _http_session(self):
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+
+    def _send_webhook(self, payload: dict):
+        url = payload["url"]
+        message = payload["message"]
+        body = {"content": message} if "discord" in url else {"text": message}
+        resp = self._http_session().post(url, json=body, timeout=self.timeout)
+        if 400 <= resp.status_code < 500 and resp.status_code != 429:
+            raise PermanentDeliveryError(f"HTTP {resp.status_code} from webhook")
+        resp.raise_for_status()
+        logger.info("Webhook notification sent")
+
+    # -------------------------
+    # Outbox
+    # -------------------------
+    def _outbox_path(self, entry_id: str, owned: bool = True) -> str:
+        name = f"{entry_id}.{os.getpid()}{OUTBOX_INFLIGHT}" if owned else f"{entry_id}.json"
+        return os.path.join(self.outbox_dir, name)
+
+    def _write_outbox(self, entry: dict) -> str:
+        path = self._outbox_path(entry["id"])
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+        self._own(path)
+        return path
+
+    def _claim_outbox(self, fname: str, entry_id: str) -> Optional[str]:
+        """Atomically take over an outbox file; None when another process got there first."""
+        path = self._outbox_path(entry_id)
+        try:
+            os.rename(os.path.join(self.outbox_dir, fname), path)
+        except FileNotFoundError:
+            return None
+        self._touch_outbox(path)
+        self._own(path)
+        return path
+
+    def _release_outbox(self, path: Optional[str], entry_id: str):
+        if path is None:
+            return
+        self._disown(path)
+        try:
+            os.replace(path, self._outbox_path(entry_id, owned=False))
+        except FileNotFoundError:
+            pass
+
+    def _touch_outbox(self, path: Optional[str]) -> bool:
+        """Refresh an owned entry's mtime; False when the file is gone (claimed elsewhere)."""
+        # the mtime tells other processes the owner is still working on it
+        if path is None:
+            return True
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _remove_outbox(self, path: Optional[str]):
+        if path is None:
+            return
+        self._disown(path)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _own(self, path: str):
+        """Track an outbox file so the heartbeat keeps it fresh while it waits in the queue."""
+        with self._owned_lock:
+            self._owned.add(path)
+            if self._heartbeat is None:
+                self._heartbeat = threading.Thread(target=self._heartbeat_loop, daemon=True,
+                                                   name="autoport-notify-heartbeat")
+                self._heartbeat.start()
+
+    def _disown(self, path: str):
+        with self._owned_lock:
+            self._owned.discard(path)
+
+    def _heartbeat_loop(self):
+        interval = self.retry_horizon() / 4
+        while not self._stop_heartbeat.wait(interval):
+            with self._owned_lock:
+                paths = list(self._owned)
+            for path in paths:
+                self._touch_outbox(path)
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher() -> NotificationDispatcher:
+    """Return the process-wide dispatcher, creating it (and re-sending the outbox) on first use."""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            load_env()
+            _dispatcher = NotificationDispatcher()
+            _dispatcher.resend_pending()
+            atexit.register(_dispatcher.close)
+        return _dispatcher
+
+
+def close_dispatcher():
+    """
+    Flush digests and wait for queued deliveries, if a dispatcher was started. CLIs call
+    this before returning: by the time atexit handlers run, the interpreter has already
+    shut the worker pool down.
+    """
+    global _dispatcher
+    with _dispatcher_lock:
+        dispatcher, _dispatcher = _dispatcher, None
+    if dispatcher is not None:
+        dispatcher.close()
+
 
 def notify_console(message: str):
     """Print message to console"""
@@ -36,52 +590,35 @@ def notify_console(message: str):
 
 
 def notify_email(subject: str, body: str, to_email: str):
-    """Send email using SMTP env vars"""
-    smtp_server = os.getenv("SMTP_SERVER", "smtp.gmail.com")
-    smtp_port = int(os.getenv("SMTP_PORT", 465))
-    smtp_user = os.getenv("SMTP_USER")
-    smtp_pass = os.getenv("SMTP_PASSWORD")
-
-    if not smtp_user or not smtp_pass:
+    """Send email using SMTP env vars (blocking, reuses the shared SMTP connection)"""
+    dispatcher = get_dispatcher()
+    if not dispatcher.smtp_user or not dispatcher.smtp_password:
         logger.warning("SMTP_USER or SMTP_PASSWORD not set, skipping email")
         return
-
-    msg = EmailMessage()
-    msg["Subject"] = subject
-    msg["From"] = smtp_user
-    msg["To"] = to_email
-    msg.set_content(body)
-
-    try:
-        with smtplib.SMTP_SSL(smtp_server, smtp_port) as smtp:
-            smtp.login(smtp_user, smtp_pass)
-            smtp.send_message(msg)
-        logger.info("Email sent to %s", to_email)
-    except Exception as e:
-        logger.error("Failed to send email: %s", e)
+    dispatcher.send_now("email", {"subject": subject, "body": body, "to": to_email})
 
 
 def notify_webhook(message: str):
-    """Send message to Discord or Slack webhook"""
+    """Send message to Discord or Slack webhook (blocking, reuses the shared HTTP session)"""
+    load_env()
     webhook_url = os.getenv("WEBHOOK_URL")
     if not webhook_url:
         logger.warning("WEBHOOK_URL not set, skipping webhook")
         return
-    if requests is None:
+    if not _requests_available():
         logger.warning("requests not installed, cannot send webhook")
         return
-    payload = {"content": message} if "discord" in webhook_url else {"text": message}
-    try:
-        requests.post(webhook_url, json=payload, timeout=10)
-        logger.info("Webhook notification sent")
-    except Exception as e:
-        logger.error("Failed to send webhook: %s", e)
+    get_dispatcher().send_now("webhook", {"message": message, "url": webhook_url})
 
 
-def notify(report_path: str, report_name: str) -> list[str]:
+def notify(report_path: str, report_name: str, wait: bool = False,
+           timeout: Optional[float] = None, urgent: bool = False) -> list[str]:
     """
     Wrapper notification function.
     Called by run_demo.py and scheduler.
+    Email and webhook are queued on the dispatcher and sent concurrently; pass
+    wait=True to block until they finish (or timeout seconds pass). In digest mode
+    the message is buffered unless urgent=True.
     Returns a list of messages about notifications sent.
     """
     messages = []
@@ -92,20 +629,25 @@ def notify(report_path: str, report_name: str) -> list[str]:
     notify_console(msg)
     messages.append(f"console: {msg}")
 
-    # Optional email
+    load_env()
     to_email = os.getenv("NOTIFY_EMAIL")
-    if to_email:
-        notify_email(
-            subject=f"[AutoPort] Report Ready: {report_name}",
-            body=msg,
-            to_email=to_email
-        )
-        messages.append(f"email: sent to {to_email}")
-
-    # Optional webhook
     webhook_url = os.getenv("WEBHOOK_URL")
-    if webhook_url:
-        notify_webhook(msg)
-        messages.append(f"webhook: sent to {webhook_url}")
+    if not to_email and not webhook_url:
+        return messages
+
+    futures = get_dispatcher().dispatch(
+        msg,
+        subject=f"[AutoPort] Report Ready: {report_name}",
+        to_email=to_email,
+        webhook=bool(webhook_url),
+        urgent=urgent,
+    )
+    queued = "queued" if urgent or get_dispatcher().digest is None else "added to digest"
+    if "email" in futures:
+        messages.append(f"email: {queued} for {to_email}")
+    if "webhook" in futures:
+        messages.append(f"webhook: {queued} for {webhook_url}")
 
+    if wait and futures:
+        wait_futures(list(futures.values()), timeout=timeout)
     return messages
@@ -0,0 +1,439 @@
+# backend/out_of_core.py
+"""
+Out-of-core helpers for report generation under a memory budget.
+
+The source is read in chunks sized from the budget and spilled to a Parquet file
+(pyarrow). The report inputs are then computed one column at a time by streaming the
+spill in row-group batches, so memory use is bounded by the budget rather than by the
+size of the source:
+
+- exact count / missing / mean / std / min / max (streaming, Chan's parallel variance)
+- approximate 25/50/75% quantiles from a Bernoulli sample (exact for small columns)
+- unique / top / freq for text columns (distinct values tracked up to a cap derived
+  from the budget)
+- a downsampled series per numeric column (per-bucket min / mean / max) for charts
+- the first rows for the sample table
+
+Usage (normally via generate_report(source, max_memory="512MB")):
+    with tempfile.TemporaryDirectory() as tmp:
+        spill = spill_to_parquet("big.csv", tmp, parse_size("512MB"))
+        profile = profile_spill(spill, parse_size("512MB"))
+"""
+
+import json
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Generator, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from backend.utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CHART_POINTS = 2000
+DEFAULT_SAMPLE_SIZE = 100_000
+HEAD_ROWS = 50
+
+# pandas parsing + the pyarrow copy need a multiple of the chunk's final size
+_CHUNK_OVERHEAD = 16
+_MIN_CHUNK_ROWS = 1_000
+# distinct-value tracking: share of the budget, and per-entry bytes on top of the text
+# (str header, dict slot, count)
+_DISTINCT_SHARE = 4
+_DISTINCT_ENTRY_BYTES = 120
+_MIN_DISTINCT = 1_000
+
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmgt]?i?b?)?\s*$", re.IGNORECASE)
+_UNITS = {"": 1, "b": 1, "k": 1024, "m": 1024 ** 2, "g": 1024 ** 3, "t": 1024 ** 4}
+
+
+def parse_size(value: Union[int, float, str]) -> int:
+    """Parse a memory budget such as 536870912, "512MB", "1.5G" or "256MiB" into bytes."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    m = _SIZE_RE.match(str(value))
+    if not m:
+        raise ValueError(f"Invalid memory size: {value!r}")
+    unit = (m.group(2) or "").lower()[:1]
+    return int(float(m.group(1)) * _UNITS[unit])
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Memory-budgeted reports need pyarrow (pip install pyarrow)") from e
+    return pa, pq
+
+
+# -------------------------
+# Reading the source in chunks
+# -------------------------
+def _json_is_lines(path: str) -> bool:
+    """
+    True for JSON-lines content: the first line is a complete JSON object and more
+    lines follow. A pretty-printed or single-line JSON document is not.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        first = f.readline()
+        try:
+            if not isinstance(json.loads(first), dict):
+                return False
+        except ValueError:
+            return False
+        return any(line.strip() for line in f)
+
+
+def iter_source_chunks(source: str, chunk_rows: int, source_type: Optional[str] = None,
+                       text_columns=()) -> Generator[pd.DataFrame, Optional[int], None]:
+    """
+    Yield the source as DataFrames of at most chunk_rows rows. CSV, JSON-lines and
+    log files are streamed; other sources (Excel, JSON arrays, APIs) can only be
+    loaded whole and are then sliced. Sending a number (chunks.send(n)) switches the
+    following chunks to n rows, so a small first chunk can be used as a probe without
+    reading the source twice. text_columns are parsed as strings where the reader
+    supports it.
+    """
+    from backend.data_ingest import _infer_type, load_data
+
+    suffix = Path(str(source)).suffix.lower()
+    stype = "jsonl" if suffix in (".jsonl", ".ndjson") else _infer_type(source, source_type)
+    dtype = {c: str for c in text_columns} or None
+
+    if stype == "csv" or stype == "jsonl" or (stype == "json" and _json_is_lines(source)):
+        if stype == "csv":
+            reader = pd.read_csv(source, chunksize=chunk_rows, dtype=dtype)
+        else:
+            reader = pd.read_json(source, lines=True, chunksize=chunk_rows, dtype=dtype)
+        with reader:
+            for chunk in reader:
+                resized = yield chunk
+                if resized:
+                    reader.chunksize = resized
+        return
+    if stype == "log":
+        rows = []
+        with open(source, "r", encoding="utf-8", errors="ignore") as f:
+            for ln in f:
+                ln = ln.strip()
+                if not ln:
+                    continue
+                rows.append({"raw": ln, "parts": ln.split()})
+                if len(rows) >= chunk_rows:
+                    resized = yield pd.DataFrame(rows)
+                    chunk_rows = resized or chunk_rows
+                    rows = []
+        if rows:
+            yield pd.DataFrame(rows)
+        return
+
+    logger.warning("%s sources cannot be streamed; loading fully before spilling", stype)
+    df = load_data(source, source_type=source_type)
+    start = 0
+    while start < len(df):
+        resized = yield df.iloc[start:start + chunk_rows]
+        start += chunk_rows
+        chunk_rows = resized or chunk_rows
+
+
+def _is_numeric(series: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+
+def _normalize(chunk: pd.DataFrame, numeric_cols: set) -> Tuple[pd.DataFrame, dict]:
+    """
+    Give every chunk the same column types: float64 for numeric columns, strings
+    otherwise. Also returns {column: count} of values in numeric columns that are not
+    numbers (and would otherwise silently become missing).
+    """
+    out = {}
+    non_numeric = {}
+    for col in chunk.columns:
+        s = chunk[col]
+        if col in numeric_cols:
+            values = pd.to_numeric(s, errors="coerce")
+            lost = int((values.isna() & s.notna()).sum())
+            if lost:
+                non_numeric[col] = lost
+            out[col] = values.astype("float64")
+        else:
+            out[col] = s.astype(object).where(s.notna(), None).map(lambda v: v if v is None else str(v))
+    return pd.DataFrame(out, columns=chunk.columns).reset_index(drop=True), non_numeric
+
+
+class _NonNumericValues(Exception):
+    """A column typed numeric from the first rows holds text further down."""
+
+    def __init__(self, counts: dict):
+        super().__init__(counts)
+        self.counts = counts
+
+
+def _date_like(columns) -> Optional[str]:
+    return next((c for c in columns if "date" in str(c).lower() or "time" in str(c).lower()), None)
+
+
+# -------------------------
+# Spill
+# -------------------------
+def spill_to_parquet(source: str, spill_dir: str, max_memory: int,
+                     source_type: Optional[str] = None) -> dict:
+    """
+    Stream the source into <spill_dir>/spill.parquet. Returns a dict with the spill
+    path, row count, columns, numeric columns, the first rows (head) and the
+    first/last values used by the summary's time-based insight.
+
+    Column types come from the first rows. When a column that looked numeric turns out
+    to hold text further down, the spill is redone with that column as text (the way
+    the in-memory path would type it) rather than counting the text as missing.
+    """
+    text_cols = set()
+    while True:
+        try:
+            return _spill(source, spill_dir, max_memory, source_type, text_cols)
+        except _NonNumericValues as e:
+            logger.warning("Non-numeric values in column(s) typed numeric from the first rows (%s); "
+                           "spilling %s again with them as text",
+                           ", ".join(f"{c}: {n}" for c, n in e.counts.items()), source)
+            text_cols.update(e.counts)
+
+
+def _spill(source: str, spill_dir: str, max_memory: int, source_type: Optional[str],
+           text_cols: set) -> dict:
+    pa, pq = _pyarrow()
+
+    chunks = iter_source_chunks(source, _MIN_CHUNK_ROWS, source_type, text_columns=text_cols)
+    probe = next(chunks, None)
+    if probe is None or probe.empty:
+        chunks.close()
+        raise ValueError(f"No rows in source: {source}")
+    bytes_per_row = max(1.0, probe.memory_usage(deep=True).sum() / len(probe))
+    chunk_rows = max(_MIN_CHUNK_ROWS, int(max_memory / (bytes_per_row * _CHUNK_OVERHEAD)))
+    logger.info("Spilling %s in chunks of %d rows (~%.0f bytes/row, budget %d bytes)",
+                source, chunk_rows, bytes_per_row, max_memory)
+
+    columns = list(probe.columns)
+    numeric_cols = {c for c in columns if c not in text_cols and _is_numeric(probe[c])}
+    date_col = _date_like(columns)
+    series_col = next((c for c in columns if c in numeric_cols), None)
+
+    def _all_chunks():
+        # the probe is the first chunk; the rest of the stream continues at chunk_rows
+        yield probe
+        try:
+            rest = chunks.send(chunk_rows)
+        except StopIteration:
+            return
+        yield rest
+        yield from chunks
+
+    path = Path(spill_dir) / "spill.parquet"
+    writer = None
+    schema = None
+    rows = 0
+    head = None
+    first_pair = last_pair = None
+    try:
+        for chunk in _all_chunks():
+            if list(chunk.columns) != columns:
+                chunk = chunk.reindex(columns=columns)
+            if head is None:
+                head = chunk.head(HEAD_ROWS).copy()
+            norm, non_numeric = _normalize(chunk, numeric_cols)
+            if non_numeric:
+                raise _NonNumericValues(non_numeric)
+
+            if date_col is not None and series_col is not None:
+                both = norm[[date_col, series_col]].dropna()
+                if len(both):
+                    if first_pair is None:
+                        first_pair = (both[date_col].iloc[0], both[series_col].iloc[0])
+                    last_pair = (both[date_col].iloc[-1], both[series_col].iloc[-1])
+
+            if schema is None:
+                schema = pa.schema([
+                    pa.field(str(c), pa.float64() if c in numeric_cols else pa.string())
+                    for c in columns
+                ])
+                writer = pq.ParquetWriter(str(path), schema)
+            norm.columns = [str(c) for c in norm.columns]
+            writer.write_table(pa.Table.from_pandas(norm, schema=schema, preserve_index=False))
+            rows += len(norm)
+    finally:
+        chunks.close()
+        if writer is not None:
+            writer.close()
+
+    logger.info("Spilled %d rows x %d columns to %s", rows, len(columns), path)
+    return {
+        "path": path,
+        "rows": rows,
+        "columns": [str(c) for c in columns],
+        "numeric": [str(c) for c in columns if c in numeric_cols],
+        "head": head,
+        "chunk_rows": chunk_rows,
+        "date_col": str(date_col) if date_col is not None else None,
+        "series_col": str(series_col) if series_col is not None else None,
+        "first_pair": first_pair,
+        "last_pair": last_pair,
+    }
+
+
+# -------------------------
+# Column-by-column profile
+# -------------------------
+def _numeric_profile(batches, total_rows: int, chart_points: int, sample_size: int, seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+    rate = min(1.0, sample_size / max(1, total_rows))
+    n_buckets = max(1, min(chart_points, total_rows))
+    bucket_size = math.ceil(total_rows / n_buckets) if total_rows else 1
+
+    n, mean, m2 = 0, 0.0, 0.0
+    vmin, vmax, total = math.inf, -math.inf, 0.0
+    missing = 0
+    sample = []
+    b_sum = np.zeros(n_buckets)
+    b_cnt = np.zeros(n_buckets, dtype=np.int64)
+    b_min = np.full(n_buckets, np.inf)
+    b_max = np.full(n_buckets, -np.inf)
+
+    offset = 0
+    for batch in batches:
+        values = batch.column(0).to_numpy(zero_copy_only=False).astype("float64", copy=False)
+        valid = ~np.isnan(values)
+        missing += int(len(values) - valid.sum())
+        buckets = (offset + np.arange(len(values))) // bucket_size
+        offset += len(values)
+        v = values[valid]
+        if len(v) == 0:
+            continue
+
+        # merge this batch's moments (Chan et al.)
+        bn, bmean = len(v), float(v.mean())
+        bm2 = float(((v - bmean) ** 2).sum())
+        delta = bmean - mean
+        tot = n + bn
+        mean += delta * bn / tot
+        m2 += bm2 + delta * delta * n * bn / tot
+        n = tot
+        total += float(v.sum())
+        vmin = min(vmin, float(v.min()))
+        vmax = max(vmax, float(v.max()))
+
+        sample.append(v if rate >= 1.0 else v[rng.random(len(v)) < rate])
+
+        # rows arrive in order, so each bucket is a contiguous run within the batch
+        b = buckets[valid]
+        starts = np.flatnonzero(np.r_[True, b[1:] != b[:-1]])
+        ub = b[starts]
+        b_sum[ub] += np.add.reduceat(v, starts)
+        b_cnt[ub] += np.diff(np.r_[starts, len(v)])
+        b_min[ub] = np.minimum(b_min[ub], np.minimum.reduceat(v, starts))
+        b_max[ub] = np.maximum(b_max[ub], np.maximum.reduceat(v, starts))
+
+    sample = np.concatenate(sample) if sample else np.array([])
+    q = np.quantile(sample, [0.25, 0.5, 0.75]) if len(sample) else [np.nan] * 3
+    has = b_cnt > 0
+    centers = (np.arange(n_buckets) * bucket_size + (bucket_size - 1) / 2.0)[has]
+    return {
+        "count": n,
+        "missing": missing,
+        "sum": total,
+        "mean": mean if n else np.nan,
+        "std": math.sqrt(m2 / (n - 1)) if n > 1 else np.nan,
+        "min": vmin if n else np.nan,
+        "25%": float(q[0]),
+        "50%": float(q[1]),
+        "75%": float(q[2]),
+        "max": vmax if n else np.nan,
+        "quantiles_exact": rate >= 1.0,
+        "chart": {
+            "x": centers,
+            "mean": (b_sum[has] / b_cnt[has]),
+            "min": b_min[has],
+            "max": b_max[has],
+        },
+    }
+
+
+def _text_profile(batches, max_bytes: int) -> dict:
+    """
+    Count distinct values while their estimated size fits in max_bytes; once the cap
+    is hit only the most frequent values seen so far keep being counted.
+    """
+    counts = Counter()
+    n = missing = 0
+    capped = False
+    max_len = 0.0
+    max_distinct = _MIN_DISTINCT
+    for batch in batches:
+        s = batch.column(0).to_pandas()
+        missing += int(s.isna().sum())
+        vc = s.value_counts(dropna=True)
+        n += int(vc.sum())
+        if capped:
+            # only keep counting values already tracked (approximate top/freq)
+            for k, v in vc.items():
+                if k in counts:
+                    counts[k] += int(v)
+            continue
+        counts.update({k: int(v) for k, v in vc.items()})
+        if len(vc):
+            # size the cap from the longest average value length seen so far
+            max_len = max(max_len, float(np.mean(vc.index.str.len())))
+            max_distinct = max(_MIN_DISTINCT, int(max_bytes // (_DISTINCT_ENTRY_BYTES + max_len)))
+        if len(counts) > max_distinct:
+            counts = Counter(dict(counts.most_common(max_distinct)))
+            capped = True
+    top, freq = counts.most_common(1)[0] if counts else (np.nan, np.nan)
+    return {
+        "count": n,
+        "missing": missing,
+        "unique": f">{max_distinct}" if capped else len(counts),
+        "top": top,
+        "freq": freq,
+    }
+
+
+def profile_spill(spill: dict, max_memory: int, chart_points: int = DEFAULT_CHART_POINTS,
+                  sample_size: int = DEFAULT_SAMPLE_SIZE, seed: int = 0) -> dict:
+    """
+    Compute per-column statistics and chart series from a spill, reading one column at
+    a time. Returns {"rows", "columns", "numeric", "head", "stats": {col: {...}}, ...}.
+    """
+    _, pq = _pyarrow()
+    pf = pq.ParquetFile(str(spill["path"]), pre_buffer=False)
+    # numeric columns are read alone as float64, so their batches can be much longer
+    # than an ingest chunk; text batches keep the ingest size (python strings are large)
+    numeric_rows = max(_MIN_CHUNK_ROWS, max_memory // (8 * _CHUNK_OVERHEAD))
+    text_rows = spill["chunk_rows"]
+    stats = {}
+    for col in spill["columns"]:
+        if col in spill["numeric"]:
+            batches = pf.iter_batches(batch_size=numeric_rows, columns=[col], use_threads=False)
+            stats[col] = _numeric_profile(batches, spill["rows"], chart_points, sample_size, seed)
+        else:
+            batches = pf.iter_batches(batch_size=text_rows, columns=[col], use_threads=False)
+            stats[col] = _text_profile(batches, max_memory // _DISTINCT_SHARE)
+    return {**spill, "stats": stats}
+
+
+def stats_frame(profile: dict) -> pd.DataFrame:
+    """describe(include="all")-style table built from a profile."""
+    numeric = set(profile["numeric"])
+    has_text = any(c not in numeric for c in profile["columns"])
+    index = ["count"]
+    if has_text:
+        index += ["unique", "top", "freq"]
+    if numeric:
+        index += ["mean", "std", "min", "25%", "50%", "75%", "max"]
+    data = {}
+    for col in profile["columns"]:
+        s = profile["stats"][col]
+        data[col] = [s.get(k, np.nan) for k in index]
+    return pd.DataFrame(data, index=index, columns=profile["columns"])
@@ -5,25 +5,48 @@ logger = get_logger(__name__)
 from pathlib import Path
 from datetime import datetime
 import pandas as pd
-import matplotlib
-matplotlib.use("Agg")  # safe headless backend
-import matplotlib.pyplot as plt
-from jinja2 import Environment, FileSystemLoader
 
 ROOT = Path(__file__).resolve().parent.parent
 TEMPLATES_DIR = ROOT / "templates"
 REPORTS_DIR = ROOT / "reports"
 CHARTS_DIR = REPORTS_DIR / "charts"
 
+_template = None
+
 def ensure_dirs():
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
     CHARTS_DIR.mkdir(parents=True, exist_ok=True)
 
-def _save_charts(df: pd.DataFrame) -> list:
+def _pyplot():
+    """Import matplotlib on first use (it is slow to import) with the headless backend."""
+    import matplotlib
+    matplotlib.use("Agg")  # safe headless backend
+    import matplotlib.pyplot as plt
+    return plt
+
+def _report_template():
+    """Load the Jinja2 report template once per process."""
+    global _template
+    if _template is None:
+        from jinja2 import Environment, FileSystemLoader
+        env = Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)))
+        _template = env.get_template("report_template.jinja2")
+    return _template
+
+def _chart_dir(report_name: str = None) -> Path:
+    """Charts of a named report go to charts/<report_name>/ so reports never share files."""
+    chart_dir = CHARTS_DIR / report_name if report_name else CHARTS_DIR
+    chart_dir.mkdir(parents=True, exist_ok=True)
+    return chart_dir
+
+def _save_charts(df: pd.DataFrame, report_name: str = None) -> list:
     charts = []
     nums = df.select_dtypes(include="number")
     if nums.empty:
         return charts
+    plt = _pyplot()
+    chart_dir = _chart_dir(report_name)
+    prefix = f"charts/{report_name}/" if report_name else "charts/"
 
     for col in nums.columns:
         plt.close("all")
@@ -37,12 +60,12 @@ def _save_charts(df: pd.DataFrame) -> list:
             ax.set_xlabel("")
             ax.set_ylabel(str(col))
             chart_name = f"{col.replace(' ', '_')}.png"
-            chart_path = CHARTS_DIR / chart_name
+            chart_path = chart_dir / chart_name
             fig.tight_layout()
             fig.savefig(chart_path)
 
             # ✅ relative path for HTML to work
-            charts.append(f"charts/{chart_name}")
+            charts.append(prefix + chart_name)
 
             plt.close(fig)
         except Exception as e:
@@ -63,7 +86,7 @@ def _save_charts(df: pd.DataFrame) -> list:
             ax.set_xlabel("")
             ax.set_ylabel(str(col))
             chart_name = f"{col.replace(' ', '_')}.png"
-            chart_path = CHARTS_DIR / chart_name
+            chart_path = chart_dir / chart_name
             fig.tight_layout()
             fig.savefig(chart_path)
             charts.append(str(chart_path))  # absolute path for easier use later
@@ -73,13 +96,76 @@ def _save_charts(df: pd.DataFrame) -> list:
             plt.close(fig)
     return charts
 
-def generate_report(df: pd.DataFrame, summary_text: str = None, report_name: str = "sample_report"):
+def _save_profile_charts(profile: dict, report_name: str = None) -> list:
+    """Charts for an out-of-core profile: per-bucket mean with the min/max range shaded."""
+    charts = []
+    if not profile["numeric"]:
+        return charts
+    plt = _pyplot()
+    chart_dir = _chart_dir(report_name)
+    prefix = f"charts/{report_name}/" if report_name else "charts/"
+
+    for col in profile["numeric"]:
+        series = profile["stats"][col]["chart"]
+        plt.close("all")
+        fig, ax = plt.subplots()
+        try:
+            ax.fill_between(series["x"], series["min"], series["max"], alpha=0.25, linewidth=0)
+            ax.plot(series["x"], series["mean"])
+            ax.set_title(col)
+            ax.set_xlabel("")
+            ax.set_ylabel(str(col))
+            chart_name = f"{col.replace(' ', '_')}.png"
+            chart_path = chart_dir / chart_name
+            fig.tight_layout()
+            fig.savefig(chart_path)
+            charts.append(prefix + chart_name)
+            plt.close(fig)
+        except Exception as e:
+            logger.warning("Could not plot column %s: %s", col, e)
+            plt.close(fig)
+    return charts
+
+def _out_of_core_inputs(source, max_memory, summary_text: str = None, source_type: str = None,
+                        report_name: str = None):
+    """Stats/table/charts/summary for generate_report computed from a disk spill of source."""
+    import tempfile
+    from backend.out_of_core import parse_size, profile_spill, spill_to_parquet, stats_frame
+    from backend.summarizer import summarize_profile
+
+    budget = parse_size(max_memory)
+    with tempfile.TemporaryDirectory(prefix="autoport-spill-") as spill_dir:
+        spill = spill_to_parquet(str(source), spill_dir, budget, source_type=source_type)
+        profile = profile_spill(spill, budget)
+
+    stats_html = stats_frame(profile).to_html(classes="table", border=0)
+    table_html = profile["head"].to_html(index=False, classes="table", border=0)
+    charts = _save_profile_charts(profile, report_name)
+    if summary_text is None:
+        summary_text = summarize_profile(profile)
+    return stats_html, table_html, charts, summary_text
+
+def generate_report(df, summary_text: str = None, report_name: str = "sample_report",
+                    pdf: bool = True, max_memory=None, source_type: str = None):
     """
-    Generate an HTML report (and attempt PDF via pdfkit, falling back to WeasyPrint).
+    Generate an HTML report (and attempt PDF via pdfkit, falling back to WeasyPrint,
+    unless pdf=False).
+    df is a DataFrame or a data source (path/URL, see load_data). With max_memory
+    (bytes or e.g. "512MB") a source is spilled to disk and the report is computed
+    column by column within that budget; the summary is generated when not given.
     Returns dict with generated file paths: {'html': Path, 'pdf': Path or None, 'charts': list of Paths}
     """
     ensure_dirs()
 
+    if not isinstance(df, pd.DataFrame):
+        if max_memory is not None:
+            stats_html, table_html, charts, summary_text = _out_of_core_inputs(
+                df, max_memory, summary_text=summary_text, source_type=source_type,
+                report_name=report_name)
+            return _write_report(report_name, summary_text, stats_html, table_html, charts, pdf)
+        from backend.data_ingest import load_data
+        df = load_data(str(df), source_type=source_type)
+
     # basic stats and table
     try:
         stats_html = df.describe(include="all").to_html(classes="table", border=0)
@@ -89,11 +175,15 @@ def generate_report(df: pd.DataFrame, summary_text: str = None, report_name: str
     table_html = df.head(50).to_html(index=False, classes="table", border=0)
 
     # charts
-    charts = _save_charts(df)
+    charts = _save_charts(df, report_name)
+
+    return _write_report(report_name, summary_text, stats_html, table_html, charts, pdf)
 
+def _write_report(report_name: str, summary_text, stats_html: str, table_html: str,
+                  charts: list, pdf: bool = True):
+    """Render the template, write the HTML (and PDF) and return the generated paths."""
     # render template
-    env = Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)))
-    template = env.get_template("report_template.jinja2")
+    template = _report_template()
 
     html_str = template.render(
         title=f"AutoPort Report — {report_name}",
@@ -110,6 +200,8 @@ def generate_report(df: pd.DataFrame, summary_text: str = None, report_name: str
 
     # attempt PDF (first pdfkit, then WeasyPrint fallback)
     pdf_path = REPORTS_DIR / f"{report_name}.pdf"
+    if not pdf:
+        return {"html": html_path, "pdf": None, "charts": charts}
     try:
         import pdfkit
         pdfkit.from_file(str(html_path), str(pdf_path))
@@ -0,0 +1,37 @@
+# backend/run_api.py
+"""
+CLI to run the AutoPort HTTP service.
+
+Usage:
+  python -m backend.run_api
+  python -m backend.run_api --host 0.0.0.0 --port 8080
+"""
+
+import argparse
+
+from backend.utils import setup_logging, get_logger, load_env
+
+logger = get_logger(__name__)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Start the AutoPort report service")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on (default 8000)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    load_env()
+    setup_logging()  # sets up root logging (console + logs/app.log)
+
+    import uvicorn
+
+    logger.info("Starting AutoPort API on %s:%s", args.host, args.port)
+    # a single process keeps the pipeline and the artifact cache warm
+    uvicorn.run("backend.api:app", host=args.host, port=args.port, log_config=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+# backend/run_benchmark.py
+"""
+Reproducible benchmark suite for AutoPort.
+
+Generates synthetic datasets (see backend.synthetic_data), then times and
+memory-profiles the pipeline stages: load_data, summarize_dataframe, _save_charts,
+generate_report (HTML only and HTML+PDF) and notify (against local SMTP and webhook
+stand-ins started by the suite). Results go to a JSON file; `compare` flags
+regressions between two result files.
+
+Usage:
+  python -m backend.run_benchmark run --rows 1000 100000 --formats csv json --output bench.json
+  python -m backend.run_benchmark run --rows 1000000 --missing-rate 0.05 --no-memory
+  python -m backend.run_benchmark compare baseline.json bench.json --threshold 0.2
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import statistics
+import tempfile
+import threading
+import tracemalloc
+import socketserver
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from backend.utils import setup_logging, get_logger
+
+logger = get_logger(__name__)
+
+STAGES = (
+    "load_data",
+    "summarize_dataframe",
+    "_save_charts",
+    "generate_report_html",
+    "generate_report_pdf",
+    "notify",
+)
+
+
+# -------------------------
+# Local stand-ins for notify
+# -------------------------
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """
+    Just enough SMTP for smtplib.SMTP: greets, accepts every command and message.
+    Setting server.rcpt_reply (e.g. b"550 no such user") makes it refuse recipients.
+    """
+
+    def handle(self):
+        self.wfile.write(b"220 autoport-bench ESMTP\r\n")
+        in_data = False
+        for line in self.rfile:
+            if in_data:
+                if line.rstrip(b"\r\n") == b".":
+                    in_data = False
+                    self.server.count += 1
+                    self.wfile.write(b"250 OK queued\r\n")
+                continue
+            cmd = line[:4].upper()
+            if cmd in (b"EHLO", b"HELO"):
+                self.wfile.write(b"250 autoport-bench\r\n")
+            elif cmd == b"RCPT" and self.server.rcpt_reply:
+                self.wfile.write(self.server.rcpt_reply + b"\r\n")
+            elif cmd == b"DATA":
+                in_data = True
+                self.wfile.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+            elif cmd == b"QUIT":
+                self.wfile.write(b"221 Bye\r\n")
+                return
+            else:
+                self.wfile.write(b"250 OK\r\n")
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    """Answers 204 and counts the post; server.statuses (if any) are answered first, in order."""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        status = self.server.statuses.pop(0) if self.server.statuses else 204
+        if status < 300:
+            self.server.count += 1
+            self.server.bodies.append(body)
+        self.send_response(status)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class StandIns:
+    """
+    Start local SMTP and webhook servers and point the notifier env vars at them (the
+    previous values are restored on exit).
+    """
+
+    def __init__(self, webhook_handler=_WebhookHandler):
+        self.smtp = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _SMTPHandler)
+        self.smtp.daemon_threads = True
+        self.smtp.count = 0
+        self.smtp.rcpt_reply = None
+        self.http = ThreadingHTTPServer(("127.0.0.1", 0), webhook_handler)
+        self.http.count = 0
+        self.http.statuses = []
+        self.http.bodies = []
+        self.outbox = tempfile.mkdtemp(prefix="autoport-bench-outbox-")
+        self._saved_env = {}
+
+    @property
+    def webhook_url(self) -> str:
+        return f"http://127.0.0.1:{self.http.server_address[1]}/hook"
+
+    def __enter__(self):
+        for server in (self.smtp, self.http):
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        env = {
+            "SMTP_SERVER": "127.0.0.1",
+            "SMTP_PORT": str(self.smtp.server_address[1]),
+            "SMTP_SSL": "0",
+            "SMTP_USER": "bench@autoport.local",
+            "SMTP_PASSWORD": "",
+            "NOTIFY_EMAIL": "bench@autoport.local",
+            "WEBHOOK_URL": self.webhook_url,
+            "AUTOPORT_OUTBOX_DIR": self.outbox,
+            "NOTIFY_DIGEST_WINDOW": "",
+            "NOTIFY_DIGEST_MAX": "",
+        }
+        self._saved_env = {k: os.environ.get(k) for k in env}
+        os.environ.update(env)
+        return self
+
+    def __exit__(self, *exc):
+        self.smtp.shutdown()
+        self.http.shutdown()
+        self.smtp.server_close()
+        self.http.server_close()
+        for k, v in self._saved_env.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+# -------------------------
+# Measurement
+# -------------------------
+def measure(fn, repeat: int = 3, memory: bool = True) -> tuple:
+    """
+    Time fn() `repeat` times; with memory=True run it once more under tracemalloc.
+    Returns (stats dict, result of the last call).
+    """
+    times = []
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - t0)
+    out = {
+        "seconds_min": min(times),
+        "seconds_median": statistics.median(times),
+        "repeat": repeat,
+    }
+    if memory:
+        tracemalloc.start()
+        try:
+            fn()
+            out["peak_mb"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        finally:
+            tracemalloc.stop()
+    return out, result
+
+
+def run_suite(rows_list, formats, repeat: int = 3, memory: bool = True, stages=STAGES,
+              workdir: str = None, seed: int = 0, **columns) -> dict:
+    """Run every requested stage for every row count; returns the results document."""
+    from backend.synthetic_data import EXCEL_MAX_ROWS, EXTENSIONS, write_dataset
+    from backend.data_ingest import load_data
+    from backend.summarizer import summarize_dataframe
+    from backend.report_generator import _save_charts, generate_report, ensure_dirs
+
+    workdir = Path(workdir or tempfile.mkdtemp(prefix="autoport-bench-"))
+    results = []
+
+    def record(stage, fmt, rows, stats, **extra):
+        entry = {"stage": stage, "format": fmt, "rows": rows, **stats, **extra}
+        results.append(entry)
+        print(f"{stage:<22} {fmt:<6} rows={rows:<9d} median={stats['seconds_median']:.4f}s"
+              + (f" peak={stats['peak_mb']:.1f}MB" if "peak_mb" in stats else ""))
+
+    ensure_dirs()
+    for rows in rows_list:
+        df = None
+        for fmt in formats:
+            if fmt == "excel" and rows > EXCEL_MAX_ROWS:
+                logger.warning("Skipping excel for rows=%d (sheet limit)", rows)
+                continue
+            path = workdir / f"data_{rows}{EXTENSIONS[fmt]}"
+            if not path.exists():
+                write_dataset(path, rows, fmt=fmt, seed=seed, **columns)
+            if "load_data" in stages:
+                stats, loaded = measure(lambda: load_data(str(path), source_type=fmt), repeat, memory)
+                record("load_data", fmt, rows, stats, bytes=path.stat().st_size)
+                if df is None and fmt != "log":
+                    df = loaded
+        if df is None:
+            from backend.synthetic_data import generate_dataframe
+            df = generate_dataframe(rows, seed=seed, **columns)
+
+        if "summarize_dataframe" in stages:
+            stats, _ = measure(lambda: summarize_dataframe(df), repeat, memory)
+            record("summarize_dataframe", "-", rows, stats)
+        if "_save_charts" in stages:
+            stats, _ = measure(lambda: _save_charts(df), repeat, memory)
+            record("_save_charts", "-", rows, stats)
+        if "generate_report_html" in stages:
+            stats, _ = measure(lambda: generate_report(df, report_name=f"bench_{rows}", pdf=False),
+                               repeat, memory)
+            record("generate_report_html", "-", rows, stats)
+        if "generate_report_pdf" in stages:
+            stats, paths = measure(lambda: generate_report(df, report_name=f"bench_{rows}"), repeat, memory)
+            record("generate_report_pdf", "-", rows, stats, pdf_created=bool(paths and paths["pdf"]))
+
+    if "notify" in stages:
+        with StandIns() as stand_ins:
+            from backend.notifier import notify
+            stats, _ = measure(lambda: notify("reports/bench.html", "bench", wait=True, timeout=30),
+                               repeat, memory)
+            delivered = {"emails": stand_ins.smtp.count, "webhooks": stand_ins.http.count}
+        record("notify", "-", 0, stats, delivered=delivered)
+
+    return {
+        "meta": {
+            "created": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rows": list(rows_list),
+            "formats": list(formats),
+            "repeat": repeat,
+            "seed": seed,
+            "columns": columns,
+        },
+        "results": results,
+    }
+
+
+# -------------------------
+# Comparison
+# -------------------------
+def _key(entry: dict) -> str:
+    return f"{entry['stage']}|{entry['format']}|{entry['rows']}"
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.2, min_seconds: float = 0.005) -> list:
+    """
+    Return regressions: entries whose median time (or peak memory) grew by more than
+    `threshold` (fractional). Time changes below min_seconds are ignored as noise.
+    """
+    old = {_key(e): e for e in baseline.get("results", [])}
+    regressions = []
+    for entry in current.get("results", []):
+        before = old.get(_key(entry))
+        if before is None:
+            continue
+        t_old, t_new = before["seconds_median"], entry["seconds_median"]
+        if t_new - t_old > min_seconds and t_new > t_old * (1 + threshold):
+            regressions.append({"key": _key(entry), "metric": "seconds_median",
+                                "before": t_old, "after": t_new, "ratio": t_new / t_old if t_old else None})
+        m_old, m_new = before.get("peak_mb"), entry.get("peak_mb")
+        if m_old and m_new and m_new > m_old * (1 + threshold) and m_new - m_old > 1:
+            regressions.append({"key": _key(entry), "metric": "peak_mb",
+                                "before": m_old, "after": m_new, "ratio": m_new / m_old})
+    return regressions
+
+
+# -------------------------
+# CLI
+# -------------------------
+def parse_args(argv=None):
+    from backend.synthetic_data import FORMATS
+
+    parser = argparse.ArgumentParser(description="AutoPort benchmark suite")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Run the benchmarks and write a results file")
+    run.add_argument("--rows", type=int, nargs="+", default=[1_000, 100_000], help="Row counts to test")
+    run.add_argument("--formats", nargs="+", choices=FORMATS, default=["csv"], help="Source formats")
+    run.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    run.add_argument("--numeric", type=int, default=4)
+    run.add_argument("--categorical", type=int, default=2)
+    run.add_argument("--dates", type=int, default=1)
+    run.add_argument("--missing-rate", type=float, default=0.0)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass")
+    run.add_argument("--workdir", help="Where datasets are written (reused between runs)")
+    run.add_argument("--output", default="benchmark_results.json")
+    run.add_argument("--baseline", help="Compare against this results file after running")
+    run.add_argument("--threshold", type=float, default=0.2)
+
+    cmp_ = sub.add_parser("compare", help="Flag regressions between two results files")
+    cmp_.add_argument("baseline")
+    cmp_.add_argument("current")
+    cmp_.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown (0.2 = 20%%)")
+    return parser.parse_args(argv)
+
+
+def _report_regressions(regressions: list) -> int:
+    for r in regressions:
+        print(f"REGRESSION {r['key']} {r['metric']}: {r['before']:.4f} -> {r['after']:.4f}"
+              + (f" (x{r['ratio']:.2f})" if r["ratio"] else ""))
+    if not regressions:
+        print("No regressions.")
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # keep the pipeline's own INFO logging off the console while timing
+    setup_logging(console_level=logging.WARNING)
+
+    if args.command == "compare":
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        with open(args.current, encoding="utf-8") as f:
+            current = json.load(f)
+        sys.exit(_report_regressions(compare(baseline, current, args.threshold)))
+
+    doc = run_suite(args.rows, args.formats, repeat=args.repeat, memory=not args.no_memory,
+                    stages=args.stages, workdir=args.workdir, seed=args.seed, numeric=args.numeric,
+                    categorical=args.categorical, dates=args.dates, missing_rate=args.missing_rate)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=2)
+    print(f"Wrote {len(doc['results'])} results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        sys.exit(_report_regressions(compare(baseline, doc, args.threshold)))
+
+
+if __name__ == "__main__":
+    main()
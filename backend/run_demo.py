@@ -1,36 +1,23 @@
-from backend.utils import setup_logging, get_logger
-setup_logging()
-logger = get_logger(__name__)
-logger.info("Logging initialized for run_demo")
-
 # backend/run_demo.py
-import logging
+# Heavy modules (pandas, matplotlib, jinja2, requests) are imported inside main() so
+# that importing this module stays cheap.
 from pathlib import Path
-import pandas as pd
-from dotenv import load_dotenv
 
-load_dotenv()  
+from backend.utils import setup_logging, get_logger, load_env
 
-# logging
-from backend.utils import setup_logging, get_logger
-setup_logging()
 log = get_logger("run_demo")
 
 
-try:
-    from .data_ingest import load_data
-    from .report_generator import generate_report
-    from .summarizer import summarize_dataframe
-except Exception:
+def main():
+    load_env()
+    setup_logging()
+    log.info("Logging initialized for run_demo")
+
     from backend.data_ingest import load_data
     from backend.report_generator import generate_report
     from backend.summarizer import summarize_dataframe
+    from backend.notifier import notify, close_dispatcher
 
-# ✅ Always import notify separately so it’s available
-from backend.notifier import notify
-
-
-def main():
     print("=== run_demo.py started ===")
 
     ROOT = Path(__file__).resolve().parent.parent
@@ -46,6 +33,7 @@ def main():
         print("Data loaded using data_ingest.load_data")
     except Exception as e:
         print(f"data_ingest.load_data failed: {e}, falling back to pandas.read_csv")
+        import pandas as pd
         df = pd.read_csv(sample_csv)
         print("Data loaded using pandas.read_csv")
 
@@ -61,9 +49,13 @@ def main():
     log.info("Report generated: HTML=%s PDF=%s", html_path, pdf_path)
 
     # Send notifications
-    errors = notify(report_path=html_path, report_name="sample_report")
-    if errors:
-        print("Notification errors:", errors)
+    try:
+        errors = notify(report_path=html_path, report_name="sample_report")
+        if errors:
+            print("Notification errors:", errors)
+    finally:
+        # flush digests and queued deliveries before interpreter shutdown stops the pool
+        close_dispatcher()
 
     print("=== run_demo.py finished ===")
 
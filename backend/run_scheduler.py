@@ -9,27 +9,19 @@ Usage:
   python -m backend.run_scheduler --once
 """
 
-from backend.utils import setup_logging, get_logger
-setup_logging()  # sets up root logging (console + logs/app.log)
-
 import os
 import argparse
 from datetime import datetime
-from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.interval import IntervalTrigger
-from apscheduler.triggers.cron import CronTrigger
-from dotenv import load_dotenv
 
-load_dotenv()
+from backend.utils import setup_logging, get_logger, load_env
 
-# Import helpers
+# Import helpers (both are cheap; report generation and APScheduler load on demand)
 from backend.scheduler import run_report_job
-from backend.notifier import notify_console, notify_email, notify_webhook
+from backend.notifier import notify_console, get_dispatcher, close_dispatcher
 
 # --- Module-specific logger ---
 # ensures logs/run_scheduler.log exists and logs here
 logger = get_logger(__name__, log_dir="logs")
-logger.info("Logging initialized for run_scheduler")
 
 # --- CLI argument parsing ---
 def parse_args():
@@ -46,6 +38,9 @@ def scheduled_job_wrapper():
     logger.info("Scheduled job started.")
     try:
         report_paths = run_report_job()
+        if not report_paths:
+            notify_failure("[AutoPort] Scheduled report generation failed. Check logs.")
+            return
         logger.info("Report generation complete: %s", report_paths)
 
         html_path = report_paths.get("html")
@@ -54,28 +49,55 @@ def scheduled_job_wrapper():
 
         notify_console(message)
 
-        smtp_user = os.getenv("SMTP_USER")
-        if smtp_user:
-            notify_email(subject=f"AutoPort Report: {report_name}", body=message, to_email=smtp_user)
-
-        notify_webhook(message)
-        logger.info("Notifications sent successfully.")
+        # email + webhook are delivered concurrently in the background (with retries);
+        # in digest mode they are batched with other runs
+        queued = get_dispatcher().dispatch(
+            message,
+            subject=f"AutoPort Report: {report_name}",
+            to_email=os.getenv("SMTP_USER"),
+        )
+        logger.info("Notifications queued: %s", ", ".join(queued) or "none")
     except Exception as e:
         logger.exception("Error during scheduled job: %s", e)
+        notify_failure(f"[AutoPort] Scheduled job crashed: {e}")
+
+
+def notify_failure(message: str):
+    """Send a failure alert immediately, bypassing any digest buffering."""
+    notify_console(message)
+    try:
+        get_dispatcher().dispatch(
+            message,
+            subject="AutoPort Report FAILED",
+            to_email=os.getenv("SMTP_USER"),
+            urgent=True,
+        )
+    except Exception as e:
+        logger.error("Could not send failure notification: %s", e)
 
 
 # --- Main scheduler ---
 def main():
     args = parse_args()
+    load_env()
+    setup_logging()  # sets up root logging (console + logs/app.log)
     logger.info("Starting run_scheduler (args=%s)", vars(args))
 
-    scheduler = BlockingScheduler()
-
     if args.once:
         logger.info("Running a single job and exiting.")
-        scheduled_job_wrapper()
+        try:
+            scheduled_job_wrapper()
+        finally:
+            # send digests / queued notifications while the worker pool is still up
+            close_dispatcher()
         return
 
+    from apscheduler.schedulers.blocking import BlockingScheduler
+    from apscheduler.triggers.interval import IntervalTrigger
+    from apscheduler.triggers.cron import CronTrigger
+
+    scheduler = BlockingScheduler()
+
     if args.test:
         logger.info("Scheduling test job: every 1 minute")
         scheduler.add_job(scheduled_job_wrapper, IntervalTrigger(minutes=1), next_run_time=datetime.now())
@@ -101,6 +123,8 @@ def main():
         logger.info("Scheduler stopped by user.")
     except Exception as exc:
         logger.exception("Scheduler crashed: %s", exc)
+    finally:
+        close_dispatcher()
 
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ Lightweight scheduler helpers for AutoPort.
 Provides:
  - run_report_job(): attempt function-mode then subprocess fallback
 """
-from backend.utils import get_logger
+from backend.utils import get_logger, log_report_metadata
 logger = get_logger(__name__)
 
 import os
@@ -14,6 +14,8 @@ import importlib
 from datetime import datetime
 
 LOG_PATH = os.environ.get("AUTOPORT_SCHEDULER_LOG", "logs/scheduler.log")
+REPORT_NAME = "sample_report"
+SOURCE_FILES = ["examples/sample.csv"]
 
 def setup_logging_dirs():
     """Ensure log directories exist."""
@@ -89,19 +91,30 @@ def try_function_mode() -> bool:
     logger.info("Function-mode did not succeed.")
     return False
 
+def record_run(status: str, details: str = None):
+    """Store the run in metadata.db; never lets a metadata error fail the job."""
+    try:
+        log_report_metadata(REPORT_NAME, SOURCE_FILES, status=status, details=details)
+    except Exception as exc:
+        logger.warning("Could not record report metadata: %s", exc)
+
 def run_report_job():
     """Main job called by the scheduler."""
     logger.info("=== Starting scheduled report job: %s ===", datetime.utcnow().isoformat())
     try:
         if try_function_mode():
             logger.info("Report generation succeeded via function-mode.")
+            record_run("success", "function-mode")
             return {"html": "reports/sample_report.html", "pdf": "reports/sample_report.pdf", "charts": []}
         logger.info("Function-mode failed. Trying subprocess fallback...")
         if run_demo_subprocess():
             logger.info("Report generation succeeded via subprocess fallback.")
+            record_run("success", "subprocess")
             return {"html": "reports/sample_report.html", "pdf": "reports/sample_report.pdf", "charts": []}
         logger.error("Report generation failed (both function-mode and subprocess). Check logs.")
+        record_run("failed", "both function-mode and subprocess failed")
         return {}
     except Exception as exc:
         logger.exception("Unexpected error in run_report_job: %s", exc)
+        record_run("failed", str(exc))
         return {}
@@ -59,3 +59,44 @@ def summarize_dataframe(df: pd.DataFrame, max_items: int = 3) -> str:
         logger.info("No meaningful summary could be generated.")
         return "No meaningful summary could be generated."
     return "\n".join(lines)
+
+def summarize_profile(profile: dict, max_items: int = 3) -> str:
+    """
+    Same summary as summarize_dataframe, built from an out-of-core profile
+    (backend.out_of_core.profile_spill) instead of an in-memory DataFrame.
+    """
+    rows, cols = profile["rows"], len(profile["columns"])
+    stats = profile["stats"]
+    logger.info("Summarizing profile: rows=%d, columns=%d", rows, cols)
+
+    lines = [f"Rows: {rows}, Columns: {cols}."]
+
+    # Missing values
+    missing = sorted(((c, stats[c]["missing"]) for c in profile["columns"] if stats[c]["missing"] > 0),
+                     key=lambda item: item[1], reverse=True)
+    if missing:
+        mv_str = ", ".join(f"{c} ({int(n)})" for c, n in missing)
+        lines.append("Missing values by column: " + mv_str)
+        logger.info("Missing values detected: %s", mv_str)
+
+    # Numeric summary
+    nums = [c for c in profile["numeric"] if stats[c]["count"] > 0]
+    if nums:
+        top_col = max(nums, key=lambda c: stats[c]["mean"])
+        lines.append(f"Top numeric column by mean: {top_col} (mean={stats[top_col]['mean']:.2f})")
+        logger.info("Top numeric column: %s (mean=%.2f)", top_col, stats[top_col]["mean"])
+
+        for c in profile["numeric"][:max_items]:
+            s = stats[c]
+            lines.append(f"{c}: sum={s['sum']:.2f}, mean={s['mean']:.2f}, min={s['min']:.2f}, max={s['max']:.2f}")
+
+    # Time-aware insight (first/last rows where the date column and first numeric column are both set)
+    first, last = profile.get("first_pair"), profile.get("last_pair")
+    if first and last and first != last:
+        series_col = profile["series_col"]
+        if first[1] != 0:
+            pct = (last[1] - first[1]) / abs(first[1]) * 100
+            lines.append(f"From {first[0]} to {last[0]}, {series_col} changed by {pct:.2f}%.")
+            logger.info("Time-based change for %s: %.2f%%", series_col, pct)
+
+    return "\n".join(lines)
@@ -0,0 +1,130 @@
+# backend/synthetic_data.py
+"""
+Synthetic dataset generator for AutoPort benchmarks.
+
+Produces reproducible (seeded) data with a configurable mix of numeric, categorical
+and date columns and a missing-value rate, and writes it in any format load_data()
+reads: CSV, Excel, JSON or plain-text logs. Large datasets are generated and written
+chunk by chunk so 10M-row files do not need 10M rows in memory.
+
+Usage:
+    df = generate_dataframe(10_000, numeric=4, categorical=2, dates=1, missing_rate=0.05)
+    path = write_dataset("bench/data.csv", rows=1_000_000, fmt="csv")
+"""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+FORMATS = ("csv", "excel", "json", "log")
+EXTENSIONS = {"csv": ".csv", "excel": ".xlsx", "json": ".json", "log": ".log"}
+EXCEL_MAX_ROWS = 1_048_575  # sheet limit minus the header row
+
+_CATEGORIES = ("alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta")
+_LOG_LEVELS = ("INFO", "INFO", "INFO", "WARNING", "ERROR", "DEBUG")
+
+
+def generate_dataframe(rows: int, numeric: int = 4, categorical: int = 2, dates: int = 1,
+                       missing_rate: float = 0.0, seed: int = 0, start_row: int = 0) -> pd.DataFrame:
+    """
+    Build a DataFrame of `rows` rows. start_row offsets date columns so consecutive
+    chunks continue the same series.
+    """
+    rng = np.random.default_rng(seed + start_row)
+    data = {}
+    for i in range(dates):
+        base = pd.Timestamp("2024-01-01") + pd.Timedelta(days=i)
+        data[f"date_{i}" if dates > 1 else "date"] = base + pd.to_timedelta(
+            np.arange(start_row, start_row + rows), unit="min")
+    for i in range(numeric):
+        if i % 2 == 0:
+            data[f"value_{i}"] = rng.normal(100 * (i + 1), 15 * (i + 1), rows).round(3)
+        else:
+            data[f"value_{i}"] = rng.integers(0, 1000, rows)
+    for i in range(categorical):
+        data[f"category_{i}"] = rng.choice(_CATEGORIES, rows)
+    df = pd.DataFrame(data)
+
+    if missing_rate > 0:
+        for col in df.columns:
+            if col.startswith("date"):
+                continue
+            mask = rng.random(rows) < missing_rate
+            if mask.any():
+                if pd.api.types.is_integer_dtype(df[col]):
+                    df[col] = df[col].astype("float64")
+                df.loc[mask, col] = np.nan
+    return df
+
+
+def _write_log_chunk(f, df: pd.DataFrame, rng: np.random.Generator):
+    levels = rng.choice(_LOG_LEVELS, len(df))
+    first_num = next((c for c in df.columns if c.startswith("value_")), None)
+    stamps = df[df.columns[0]].astype(str) if len(df.columns) else pd.Series([""] * len(df))
+    values = df[first_num].astype(str) if first_num else pd.Series([""] * len(df))
+    for ts, level, value in zip(stamps, levels, values):
+        f.write(f"{ts} {level} worker value={value}\n")
+
+
+def write_dataset(path: str, rows: int, fmt: Optional[str] = None, chunk_rows: int = 500_000,
+                  seed: int = 0, **columns) -> Path:
+    """
+    Generate `rows` rows and write them to `path` in `fmt` (inferred from the suffix
+    when omitted). Extra keyword arguments go to generate_dataframe().
+    """
+    path = Path(path)
+    fmt = (fmt or next((k for k, v in EXTENSIONS.items() if v == path.suffix.lower()), "csv")).lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported format: {fmt}")
+    if fmt == "excel" and rows > EXCEL_MAX_ROWS:
+        raise ValueError(f"Excel sheets hold at most {EXCEL_MAX_ROWS} data rows (asked for {rows})")
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if fmt == "excel":
+        generate_dataframe(rows, seed=seed, **columns).to_excel(path, index=False, engine="openpyxl")
+        return path
+
+    rng = np.random.default_rng(seed)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if fmt == "json":
+            f.write("[")
+        for n, start in enumerate(range(0, rows, chunk_rows)):
+            chunk = generate_dataframe(min(chunk_rows, rows - start), seed=seed, start_row=start, **columns)
+            if fmt == "csv":
+                chunk.to_csv(f, index=False, header=(n == 0))
+            elif fmt == "json":
+                body = chunk.to_json(orient="records", date_format="iso")[1:-1]
+                if body:
+                    f.write(("," if n else "") + body)
+            else:
+                _write_log_chunk(f, chunk, rng)
+        if fmt == "json":
+            f.write("]")
+    return path
+
+
+def describe_dataset(path: Path) -> dict:
+    """Small, JSON-serialisable description of a written dataset."""
+    path = Path(path)
+    return {"path": str(path), "bytes": path.stat().st_size}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Write a synthetic AutoPort dataset")
+    parser.add_argument("path")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--format", choices=FORMATS)
+    parser.add_argument("--numeric", type=int, default=4)
+    parser.add_argument("--categorical", type=int, default=2)
+    parser.add_argument("--dates", type=int, default=1)
+    parser.add_argument("--missing-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    out = write_dataset(args.path, args.rows, fmt=args.format, seed=args.seed, numeric=args.numeric,
+                        categorical=args.categorical, dates=args.dates, missing_rate=args.missing_rate)
+    print(json.dumps(describe_dataset(out)))
@@ -4,14 +4,21 @@ Logging and lightweight metadata DB utilities for AutoPort (Phase G).
 Provides:
  - setup_logging(): root console + app.log rotating handler
  - get_logger(name): returns a module-specific logger that writes to logs/<shortname>.log
- - init_metadata_db(), log_report_metadata(), list_reports()
+ - JsonFormatter: optional JSON-lines log format (AUTOPORT_LOG_FORMAT=json)
+ - queue mode (AUTOPORT_LOG_QUEUE=1 or setup_logging(use_queue=True)): loggers only
+   enqueue records; one background QueueListener formats them and does all file/console I/O
+ - shutdown_logging(): stop the listener and flush pending records
+ - load_env(): load .env once (if python-dotenv is installed); call from entry points
+ - init_metadata_db(), log_report_metadata(), list_reports(), query_reports()
 """
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import atexit
 import os
-import sqlite3
+import queue
 import json
-from datetime import datetime
+import threading
+from datetime import datetime, timezone
 from typing import Iterable
 
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
@@ -21,14 +28,156 @@ DEFAULT_DB = os.path.join(BASE_DIR, 'metadata.db')
 def ensure_dir(path):
     os.makedirs(path, exist_ok=True)
 
+_env_loaded = False
+
+def load_env():
+    """Load .env into os.environ on first call (no-op without python-dotenv)."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv()
+
+TEXT_FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line (JSON-lines)."""
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "line": record.lineno,
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+_log_format = None  # format chosen by setup_logging(), inherited by get_logger()
+
+def _make_formatter(log_format: str = None):
+    log_format = (log_format or _log_format or os.environ.get("AUTOPORT_LOG_FORMAT") or "text").lower()
+    if log_format == "json":
+        return JsonFormatter()
+    return logging.Formatter(TEXT_FORMAT)
+
+def _env_flag(name: str, default: bool = False) -> bool:
+    """1/true/yes/on -> True, 0/false/no/off -> False, unset or anything else -> default."""
+    value = os.environ.get(name, "").strip().lower()
+    if value in ("1", "true", "yes", "on"):
+        return True
+    if value in ("0", "false", "no", "off"):
+        return False
+    return default
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that only merges msg % args on the calling thread (so later mutation
+    of args cannot change the message); all formatting happens in the listener.
+    """
+
+    def prepare(self, record):
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+class _ModuleFileRouter(logging.Handler):
+    """
+    Listener-side handler that writes each record to the per-module file handler(s)
+    registered by get_logger(), mirroring what logger propagation does without a queue.
+    """
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self._handlers = {}
+        self._lock_routes = threading.Lock()
+
+    def register(self, name: str, handler: logging.Handler):
+        with self._lock_routes:
+            self._handlers[name] = handler
+
+    def emit(self, record):
+        name = record.name
+        while name:
+            handler = self._handlers.get(name)
+            if handler is not None and record.levelno >= handler.level:
+                handler.handle(record)
+            name = name.rpartition('.')[0]
+
+    def close(self):
+        with self._lock_routes:
+            for handler in self._handlers.values():
+                handler.close()
+        super().close()
+
+_queue_listener = None
+_module_router = None
+_module_handlers = {}  # logger name -> its RotatingFileHandler
+
+def _start_queue_logging(root_logger, handlers, level):
+    global _queue_listener, _module_router
+    _module_router = _ModuleFileRouter()
+    log_queue = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, *handlers, _module_router, respect_handler_level=True)
+    qh = _DeferredQueueHandler(log_queue)
+    qh.setLevel(level)
+    root_logger.addHandler(qh)
+
+    # move per-module file handlers created before setup_logging() behind the queue
+    for name, handler in _module_handlers.items():
+        logging.getLogger(name).removeHandler(handler)
+        _module_router.register(name, handler)
+
+    _queue_listener.start()
+    atexit.register(shutdown_logging)
+
+def shutdown_logging():
+    """
+    Stop the queue listener (if running), writing out everything still queued, and
+    attach its handlers directly so records logged afterwards are not lost.
+    """
+    global _queue_listener, _module_router
+    listener, _queue_listener = _queue_listener, None
+    if listener is None:
+        return
+    listener.stop()
+
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, _DeferredQueueHandler):
+            root_logger.removeHandler(handler)
+    for handler in listener.handlers:
+        if handler is not _module_router:
+            root_logger.addHandler(handler)
+    for name, handler in _module_handlers.items():
+        logging.getLogger(name).addHandler(handler)
+    _module_router = None
+
 def setup_logging(log_dir: str = None,
                   console_level=logging.INFO,
                   file_level=logging.INFO,
                   max_bytes: int = 5 * 1024 * 1024,
-                  backup_count: int = 5):
+                  backup_count: int = 5,
+                  use_queue: bool = None,
+                  log_format: str = None):
     """
     Configure root logger once. Creates logs/app.log and console handler.
     Call early in entrypoint scripts (run_demo.py, run_scheduler.py).
+
+    use_queue: hand records to a background listener instead of writing them on the
+               calling thread (default: AUTOPORT_LOG_QUEUE env var).
+    log_format: "text" (default) or "json" for JSON-lines (default: AUTOPORT_LOG_FORMAT).
     """
     log_dir = log_dir or LOG_DIR
     ensure_dir(log_dir)
@@ -39,29 +188,43 @@ def setup_logging(log_dir: str = None,
         return
     root_logger.setLevel(logging.DEBUG)
 
-    fmt = logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s')
+    global _log_format
+    _log_format = log_format or _log_format
+    fmt = _make_formatter()
 
     # Console handler
     ch = logging.StreamHandler()
     ch.setLevel(console_level)
     ch.setFormatter(fmt)
-    root_logger.addHandler(ch)
 
     # Rotating file for general app-level messages
     app_log = os.path.join(log_dir, 'app.log')
     fh = RotatingFileHandler(app_log, maxBytes=max_bytes, backupCount=backup_count)
     fh.setLevel(file_level)
     fh.setFormatter(fmt)
-    root_logger.addHandler(fh)
+
+    if use_queue is None:
+        use_queue = _env_flag("AUTOPORT_LOG_QUEUE")
+    # loggers created before setup_logging() switch to the configured format
+    for handler in _module_handlers.values():
+        handler.setFormatter(fmt)
+
+    if use_queue:
+        _start_queue_logging(root_logger, (ch, fh), min(console_level, file_level, logging.INFO))
+    else:
+        root_logger.addHandler(ch)
+        root_logger.addHandler(fh)
 
     root_logger._autoport_configured = True
 
 def get_logger(name: str, log_dir: str = None,
                file_level=logging.INFO,
                max_bytes: int = 5 * 1024 * 1024,
-               backup_count: int = 5):
+               backup_count: int = 5,
+               log_format: str = None):
     """
     Return a logger which writes to logs/<shortname>.log and also propagates to root.
+    In queue mode the file is written by the background listener instead.
     Example: logger = get_logger(__name__)
     """
     log_dir = log_dir or LOG_DIR
@@ -74,13 +237,17 @@ def get_logger(name: str, log_dir: str = None,
         return logger
 
     logger.setLevel(logging.DEBUG)
-    fmt = logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s')
+    fmt = _make_formatter(log_format)
 
     file_path = os.path.join(log_dir, f'{short}.log')
     fh = RotatingFileHandler(file_path, maxBytes=max_bytes, backupCount=backup_count)
     fh.setLevel(file_level)
     fh.setFormatter(fmt)
-    logger.addHandler(fh)
+    _module_handlers[name] = fh
+    if _module_router is not None:
+        _module_router.register(name, fh)
+    else:
+        logger.addHandler(fh)
 
     # Let messages also propagate to root (console + app.log)
     logger.propagate = True
@@ -89,41 +256,26 @@ def get_logger(name: str, log_dir: str = None,
 
 # -------------------------
 # Simple metadata DB helpers (optional, recommended)
+# Thin wrappers over backend.metadata_store (shared WAL connection, indexes, queries).
 # -------------------------
 def init_metadata_db(db_path: str = None):
-    db_path = db_path or DEFAULT_DB
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    c.execute('''
-    CREATE TABLE IF NOT EXISTS reports (
-      id INTEGER PRIMARY KEY,
-      name TEXT,
-      timestamp TEXT,
-      source_files TEXT,
-      status TEXT,
-      details TEXT
-    )
-    ''')
-    conn.commit()
-    conn.close()
-    return db_path
+    from backend.metadata_store import get_store
+    store = get_store(db_path)
+    store.connection()
+    return store.db_path
 
 def log_report_metadata(name: str, source_files: Iterable[str], status: str = 'success', details: str = None, db_path: str = None):
-    db_path = db_path or init_metadata_db()
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    ts = datetime.utcnow().isoformat() + 'Z'
-    c.execute('INSERT INTO reports (name, timestamp, source_files, status, details) VALUES (?,?,?,?,?)',
-              (name, ts, json.dumps(list(source_files)), status, details or ""))
-    conn.commit()
-    conn.close()
-    return True
+    from backend.metadata_store import get_store
+    return get_store(db_path).log(name, source_files, status=status, details=details)
 
 def list_reports(limit: int = 20, db_path: str = None):
-    db_path = db_path or DEFAULT_DB
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    c.execute('SELECT id, name, timestamp, status FROM reports ORDER BY id DESC LIMIT ?', (limit,))
-    rows = c.fetchall()
-    conn.close()
-    return rows
+    from backend.metadata_store import get_store
+    rows = get_store(db_path).query(limit=limit)
+    return [(r["id"], r["name"], r["timestamp"], r["status"]) for r in rows]
+
+def query_reports(name: str = None, status: str = None, since=None, until=None,
+                  limit: int = 20, offset: int = 0, db_path: str = None):
+    """Filtered, paginated report runs as dicts (see MetadataStore.query)."""
+    from backend.metadata_store import get_store
+    return get_store(db_path).query(name=name, status=status, since=since, until=until,
+                                    limit=limit, offset=offset)
@@ -0,0 +1,182 @@
+# tests/test_notifier.py
+"""NotificationDispatcher against the local SMTP / webhook stand-ins from the benchmark suite."""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from backend.notifier import NotificationDispatcher
+from backend.run_benchmark import StandIns, _WebhookHandler
+
+
+class _GatedWebhookHandler(_WebhookHandler):
+    """Holds every post until server.gate is set."""
+
+    def do_POST(self):
+        self.server.gate.wait(10)
+        super().do_POST()
+
+
+@pytest.fixture
+def stand_ins():
+    with StandIns() as s:
+        yield s
+
+
+def _dispatcher(outbox, **kwargs):
+    kwargs.setdefault("backoff", 0.01)
+    kwargs.setdefault("timeout", 5)
+    return NotificationDispatcher(outbox_dir=str(outbox), **kwargs)
+
+
+def _webhook_payload(stand_ins, message="hello"):
+    return {"message": message, "url": stand_ins.webhook_url}
+
+
+def _put_entry(outbox, name, entry_id, url):
+    path = outbox / name
+    path.write_text(json.dumps({
+        "id": entry_id,
+        "channel": "webhook",
+        "payload": {"message": entry_id, "url": url},
+        "created": time.time(),
+    }))
+    return path
+
+
+def _dead_pid() -> int:
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def test_dispatch_fans_out_to_email_and_webhook(stand_ins, tmp_path):
+    d = _dispatcher(tmp_path)
+    try:
+        futures = d.dispatch("report ready", subject="s", to_email="ops@autoport.local")
+        assert set(futures) == {"email", "webhook"}
+        assert all(f.result(timeout=10) for f in futures.values())
+    finally:
+        d.close()
+    assert stand_ins.smtp.count == 1
+    assert stand_ins.http.count == 1
+    assert os.listdir(tmp_path) == []
+
+
+def test_retries_then_succeeds(stand_ins, tmp_path):
+    stand_ins.http.statuses = [500, 503]
+    d = _dispatcher(tmp_path)
+    try:
+        assert d.submit("webhook", _webhook_payload(stand_ins)).result(timeout=10) is True
+    finally:
+        d.close()
+    assert stand_ins.http.count == 1
+    assert os.listdir(tmp_path) == []
+
+
+def test_webhook_4xx_is_permanent(stand_ins, tmp_path):
+    stand_ins.http.statuses = [404, 404, 404]
+    d = _dispatcher(tmp_path)
+    try:
+        assert d.submit("webhook", _webhook_payload(stand_ins)).result(timeout=10) is False
+    finally:
+        d.close()
+    assert stand_ins.http.statuses == [404, 404]  # tried once
+    assert os.listdir(tmp_path) == []
+
+
+def test_smtp_5xx_is_permanent(stand_ins, tmp_path):
+    stand_ins.smtp.rcpt_reply = b"550 no such user"
+    d = _dispatcher(tmp_path)
+    try:
+        future = d.dispatch("report ready", to_email="nobody@autoport.local", webhook=False)["email"]
+        assert future.result(timeout=10) is False
+    finally:
+        d.close()
+    assert stand_ins.smtp.count == 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_failed_entry_is_released_and_resent(stand_ins, tmp_path):
+    stand_ins.http.statuses = [500, 500, 500]
+    d = _dispatcher(tmp_path, max_retries=3)
+    try:
+        assert d.submit("webhook", _webhook_payload(stand_ins)).result(timeout=10) is False
+    finally:
+        d.close()
+    (released,) = os.listdir(tmp_path)
+    assert released.endswith(".json")
+
+    d = _dispatcher(tmp_path)
+    try:
+        futures = d.resend_pending()
+        assert [f.result(timeout=10) for f in futures] == [True]
+    finally:
+        d.close()
+    assert stand_ins.http.count == 1
+    assert os.listdir(tmp_path) == []
+
+
+def test_resend_pending_only_claims_abandoned_entries(stand_ins, tmp_path):
+    live = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        url = stand_ins.webhook_url
+        _put_entry(tmp_path, "1-free.json", "1-free", url)
+        _put_entry(tmp_path, f"2-dead.{_dead_pid()}.inflight", "2-dead", url)
+        _put_entry(tmp_path, f"3-live.{live.pid}.inflight", "3-live", url)
+        stale = _put_entry(tmp_path, f"4-stale.{live.pid}.inflight", "4-stale", url)
+        os.utime(stale, (0, 0))
+        _put_entry(tmp_path, f"5-mine.{os.getpid()}.inflight", "5-mine", url)
+
+        d = _dispatcher(tmp_path)
+        try:
+            assert all(f.result(timeout=10) for f in d.resend_pending())
+        finally:
+            d.close()
+    finally:
+        live.kill()
+        live.wait()
+
+    sent = sorted(b.decode() for b in stand_ins.http.bodies)
+    assert sent == sorted(f'{{"text": "{i}"}}' for i in ("1-free", "2-dead", "4-stale"))
+    assert sorted(os.listdir(tmp_path)) == [f"3-live.{live.pid}.inflight", f"5-mine.{os.getpid()}.inflight"]
+
+
+def test_entry_claimed_elsewhere_is_not_sent(tmp_path):
+    with StandIns(webhook_handler=_GatedWebhookHandler) as stand_ins:
+        stand_ins.http.gate = threading.Event()
+        d = _dispatcher(tmp_path, max_workers=1)
+        try:
+            first = d.submit("webhook", _webhook_payload(stand_ins, "first"))
+            queued = d.submit("webhook", _webhook_payload(stand_ins, "second"))
+            queued_file = next(f for f in os.listdir(tmp_path) if '"second"' in (tmp_path / f).read_text())
+            # another process takes the queued entry over while the worker is busy
+            taken = queued_file.replace(f".{os.getpid()}.", ".999999.")
+            os.rename(tmp_path / queued_file, tmp_path / taken)
+            stand_ins.http.gate.set()
+            assert first.result(timeout=10) is True
+            assert queued.result(timeout=10) is False
+        finally:
+            d.close()
+        assert stand_ins.http.count == 1
+        assert os.listdir(tmp_path) == [taken]
+
+
+def test_stale_digest_timer_does_not_flush_newer_bucket(stand_ins, tmp_path):
+    d = _dispatcher(tmp_path, digest_window=60, digest_max=2)
+    try:
+        key = ("webhook", stand_ins.webhook_url)
+        d.dispatch("one")
+        old_bucket = d.digest._buckets[key]
+        d.dispatch("two")  # count limit: sent, old timer cancelled
+        d.dispatch("three")  # new bucket for the same key
+        d.digest._flush_expired(key, old_bucket)  # the cancelled timer firing late
+        assert d.digest.pending() == 1
+    finally:
+        d.close()
+    assert stand_ins.http.count == 2
@@ -0,0 +1,103 @@
+# tests/test_out_of_core.py
+"""Out-of-core profile vs the in-memory describe(), on small synthetic sources."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from backend.data_ingest import load_data
+from backend.out_of_core import _MIN_CHUNK_ROWS, _text_profile, profile_spill, spill_to_parquet, stats_frame
+from backend.synthetic_data import generate_dataframe
+
+BUDGET = 8 * 1024 * 1024  # chunks of a few thousand rows after the 1,000-row probe
+
+
+def _profile(path, tmp_path, budget=BUDGET):
+    spill_dir = tmp_path / "spill"
+    spill_dir.mkdir(exist_ok=True)
+    spill = spill_to_parquet(str(path), str(spill_dir), budget)
+    return spill, profile_spill(spill, budget)
+
+
+def _assert_matches_describe(profile, expected: pd.DataFrame, skip=()):
+    got = stats_frame(profile)
+    assert list(got.columns) == list(expected.columns)
+    for col in expected.columns:
+        for stat in expected.index:
+            if (col, stat) in skip or stat not in got.index:
+                continue
+            want, have = expected.at[stat, col], got.at[stat, col]
+            if pd.isna(want):
+                assert pd.isna(have), (col, stat)
+            elif isinstance(want, (int, float, np.number)):
+                assert have == pytest.approx(float(want), rel=1e-9), (col, stat)
+            else:
+                assert str(have) == str(want), (col, stat)
+
+
+def test_profile_matches_describe(tmp_path):
+    path = tmp_path / "data.csv"
+    generate_dataframe(10_000, numeric=3, categorical=2, dates=1, missing_rate=0.05).to_csv(path, index=False)
+
+    spill, profile = _profile(path, tmp_path)
+    assert spill["rows"] == 10_000
+    assert spill["chunk_rows"] > _MIN_CHUNK_ROWS  # the stream was resized after the probe
+    expected = pd.read_csv(path).describe(include="all")
+    # every date is unique, so which one is "top" is arbitrary
+    _assert_matches_describe(profile, expected, skip={("date", "top"), ("date", "freq")})
+
+
+def test_numeric_column_with_text_later_is_profiled_as_text(tmp_path):
+    df = generate_dataframe(5_000, numeric=2, categorical=1, dates=0)
+    df["value_1"] = df["value_1"].astype(object)
+    df.loc[3_000, "value_1"] = "oops"
+    path = tmp_path / "mixed.csv"
+    df.to_csv(path, index=False)
+
+    spill, profile = _profile(path, tmp_path)
+    assert "value_1" not in spill["numeric"]
+    assert profile["stats"]["value_1"]["missing"] == 0
+    _assert_matches_describe(profile, pd.read_csv(path).describe(include="all"))
+
+
+@pytest.mark.parametrize("indent", [2, None])
+def test_json_object_document(tmp_path, indent):
+    records = generate_dataframe(5, numeric=2, categorical=1, dates=0).to_dict(orient="records")
+    path = tmp_path / "items.json"
+    path.write_text(json.dumps({"items": records}, indent=indent))
+
+    spill, _ = _profile(path, tmp_path)
+    assert spill["rows"] == len(load_data(str(path))) == 5
+
+
+def test_json_lines_and_log_are_streamed(tmp_path):
+    df = generate_dataframe(3_000, numeric=2, categorical=1, dates=0)
+    jsonl = tmp_path / "data.json"
+    df.to_json(jsonl, orient="records", lines=True)
+    spill, profile = _profile(jsonl, tmp_path, budget=256 * 1024)
+    assert spill["rows"] == 3_000
+    _assert_matches_describe(profile, df.describe(include="all"))
+
+    log = tmp_path / "app.log"
+    log.write_text("".join(f"2024-01-01 INFO worker value={i}\n" for i in range(2_500)))
+    spill, _ = _profile(log, tmp_path, budget=64 * 1024)
+    assert spill["rows"] == 2_500
+
+
+def test_distinct_cap_follows_budget():
+    pa = pytest.importorskip("pyarrow")
+    values = ["common"] * 10 + [f"value-{i:06d}" for i in range(50_000)]
+    batches = [pa.record_batch([pa.array(values[i:i + 10_000])], names=["c"])
+               for i in range(0, len(values), 10_000)]
+
+    small = _text_profile(iter(batches), max_bytes=200_000)
+    assert isinstance(small["unique"], str) and small["unique"].startswith(">")
+    assert small["count"] == len(values)
+    assert small["top"] == "common" and small["freq"] == 10
+
+    large = _text_profile(iter(batches), max_bytes=64 * 1024 * 1024)
+    assert large["unique"] == 50_001
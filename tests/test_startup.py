@@ -0,0 +1,8 @@
+# tests/test_startup.py
+"""Entry points must import without heavy dependencies and within the import-time budget."""
+
+from backend import check_startup
+
+
+def test_entry_points_within_import_budget():
+    assert check_startup.check() == []